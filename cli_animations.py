@@ -3,12 +3,17 @@ CLI Animation Module for Speech-to-Speech AI
 Pure ASCII/Unicode animations - no emojis.
 """
 
+import re
+import heapq
 import sys
 import time
 import threading
+import traceback
 import math
-from itertools import cycle
+from itertools import count, cycle
+from operator import mul
 from contextlib import contextmanager
+from functools import lru_cache
 
 
 class Colors:
@@ -31,343 +36,490 @@ class Colors:
     CYAN = "\033[96m"
     WHITE = "\033[97m"
     
-    # 256 color support for gradients
+    # 256 color support for gradients (each escape is built once)
     @staticmethod
+    @lru_cache(maxsize=256)
     def fg(n):
         return f"\033[38;5;{n}m"
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def bg(n):
         return f"\033[48;5;{n}m"
 
 
+class _SineBank:
+    """Per-column sine oscillators for the waveform animations.
+
+    Column i tracks sin/cos of (i * freq + phase * mult). Since phase grows
+    by a fixed step every frame, each frame is a rotation by the same angle,
+    so the values are advanced with the angle-addition identity instead of
+    calling math.sin per column.
+    """
+
+    __slots__ = ("sin", "cos", "_cos_d", "_sin_d")
+
+    def __init__(self, width: int, freq: float, mult: float, step: float):
+        self.sin = [math.sin(i * freq) for i in range(width)]
+        self.cos = [math.cos(i * freq) for i in range(width)]
+        self._cos_d = math.cos(step * mult)
+        self._sin_d = math.sin(step * mult)
+
+    def advance(self):
+        """Rotate every column forward by one frame."""
+        cd, sd = self._cos_d, self._sin_d
+        s, c = self.sin, self.cos
+        self.sin = [si * cd + ci * sd for si, ci in zip(s, c)]
+        self.cos = [ci * cd - si * sd for si, ci in zip(s, c)]
+
+
+# Sine lookup table for scalar per-frame oscillators. The size is a power of
+# two so integer phase indices wrap with a mask.
+_SIN_N = 1024
+_SIN_MASK = _SIN_N - 1
+_SIN_TABLE = tuple(math.sin(2 * math.pi * k / _SIN_N) for k in range(_SIN_N))
+
+
+def _phase_step(radians: float) -> int:
+    """Convert a per-frame phase advance in radians to a table index step."""
+    return round(radians * _SIN_N / (2 * math.pi))
+
+
+# Terminal control sequences
+_CLEAR_LINE = "\r\033[K"
+_HIDE_CURSOR = "\033[?25l"
+_SHOW_CURSOR = "\033[?25h"
+
+
+def _encode(text: str) -> bytes:
+    """Encode text for the terminal's byte stream."""
+    return text.encode(getattr(sys.stdout, "encoding", None) or "utf-8", "replace")
+
+
+def _encode_cells(chars) -> tuple:
+    """Encode each single-character cell once so frames can be joined as bytes."""
+    return tuple(_encode(c) for c in chars)
+
+
+def _emit(data: bytes):
+    """Write one complete frame with a single write and a single flush."""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(data.decode(getattr(stream, "encoding", None) or "utf-8", "replace"))
+        stream.flush()
+        return
+    # Push out anything print() left in the text layer so ordering holds
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _wave_indices(waves, amps, offset, scale, top, out):
+    """Fill out[i] with the 0..top index of sum(amp * wave[i]) for a frame."""
+    for i, vals in enumerate(zip(*waves)):
+        idx = int((sum(map(mul, amps, vals)) + offset) * scale)
+        out[i] = top if idx > top else (0 if idx < 0 else idx)
+
+
+class _AnimScheduler:
+    """One shared daemon thread that renders every active animation.
+
+    Animations are kept in a heap ordered by their next frame deadline. The
+    lock is held while a frame is drawn, so once stop() has unregistered an
+    animation no further frame of it can reach the terminal.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []  # (deadline, seq, animation, token)
+        self._seq = count()
+        self._thread = None
+
+    def add(self, anim, token):
+        """Schedule anim to render right away and then every anim.interval."""
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), anim, token))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def remove(self, anim):
+        """Unregister anim; returns once any in-progress frame has finished."""
+        with self._cond:
+            anim._token = None
+
+    def _run(self):
+        heap = self._heap
+        with self._cond:
+            while True:
+                if not heap:
+                    self._cond.wait()
+                    continue
+                
+                deadline, _, anim, token = heap[0]
+                if anim._token is not token:
+                    # Stopped (or restarted) since this entry was queued
+                    heapq.heappop(heap)
+                    continue
+                
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                
+                heapq.heappop(heap)
+                try:
+                    anim._tick()
+                except Exception:
+                    # Drop the broken animation but keep serving the others
+                    anim._token = None
+                    traceback.print_exc()
+                    continue
+                heapq.heappush(heap, (time.monotonic() + anim.interval, next(self._seq), anim, token))
+
+
+_SCHEDULER = _AnimScheduler()
+
+
 class AnimatedState:
     """Base class for animated CLI states."""
     
+    # Seconds between frames
+    interval = 0.1
+    
     def __init__(self, message: str = "", color: str = Colors.WHITE):
         self.message = message
         self.color = color
-        self._stop_event = threading.Event()
-        self._thread = None
-    
-    def _clear_line(self):
-        """Clear the current line."""
-        sys.stdout.write('\r\033[K')
-        sys.stdout.flush()
+        self._token = None
+        self._lead = b""
     
-    def _hide_cursor(self):
-        sys.stdout.write('\033[?25l')
-        sys.stdout.flush()
+    def _write_frame(self, frame: bytes):
+        """Emit a frame, prefixed by any pending control sequence."""
+        _emit(self._lead + frame)
+        self._lead = b""
     
-    def _show_cursor(self):
-        sys.stdout.write('\033[?25h')
-        sys.stdout.flush()
-    
-    def _animate(self):
-        """Animation loop - override in subclasses."""
+    def _tick(self):
+        """Render one frame - override in subclasses."""
         raise NotImplementedError
     
     def start(self):
-        """Start the animation in a separate thread."""
-        self._stop_event.clear()
-        self._hide_cursor()
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
+        """Start the animation on the shared scheduler thread."""
+        # Cursor is hidden as part of the first frame's write
+        self._lead = _encode(_HIDE_CURSOR)
+        self._token = object()
+        _SCHEDULER.add(self, self._token)
     
     def stop(self):
         """Stop the animation."""
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=1)
-        self._clear_line()
-        self._show_cursor()
+        _SCHEDULER.remove(self)
+        _emit(_encode(_CLEAR_LINE + _SHOW_CURSOR))
 
 
 class ListeningAnimation(AnimatedState):
     """Animated audio waveform for recording state."""
     
+    interval = 0.05
+    
     def __init__(self, duration: int = 5):
         super().__init__("LISTENING", Colors.CYAN)
         self.duration = duration
         self.width = 40
-        
-    def _animate(self):
-        start_time = time.time()
-        phase = 0
+        self._start_time = 0.0
         
         # Block characters for waveform
-        blocks = " ▁▂▃▄▅▆▇█"
-        
-        while not self._stop_event.is_set():
-            elapsed = time.time() - start_time
-            remaining = max(0, self.duration - elapsed)
-            
-            # Generate dynamic waveform
-            wave = []
-            for i in range(self.width):
-                # Multiple sine waves for organic look
-                val = (
-                    math.sin((i * 0.3) + phase) * 0.4 +
-                    math.sin((i * 0.5) + phase * 1.3) * 0.3 +
-                    math.sin((i * 0.7) + phase * 0.7) * 0.3
-                )
-                # Normalize to 0-8 range
-                idx = int((val + 1) * 4)
-                idx = max(0, min(8, idx))
-                wave.append(blocks[idx])
-            
-            waveform = "".join(wave)
-            
-            # Progress bar
-            progress = min(1.0, elapsed / self.duration)
-            prog_width = 10
-            filled = int(prog_width * progress)
-            prog_bar = f"[{'=' * filled}{' ' * (prog_width - filled)}]"
-            
-            output = (
-                f"\r{Colors.CYAN}{Colors.BOLD}>> {self.message} "
-                f"{Colors.RESET}{Colors.CYAN}{waveform} "
-                f"{Colors.DIM}{remaining:.1f}s {prog_bar}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 0.15
-            time.sleep(0.05)
+        self._blocks = _encode_cells(" ▁▂▃▄▅▆▇█")
+        
+        # Multiple sine waves for organic look (phase advances 0.15/frame)
+        self._waves = (
+            _SineBank(self.width, 0.3, 1.0, 0.15),
+            _SineBank(self.width, 0.5, 1.3, 0.15),
+            _SineBank(self.width, 0.7, 0.7, 0.15),
+        )
+        self._out = [0] * self.width
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{Colors.CYAN}{Colors.BOLD}>> {self.message} {Colors.RESET}{Colors.CYAN}")
+        self._mid = _encode(f" {Colors.DIM}")
+        self._suf = _encode(Colors.RESET)
+    
+    def start(self):
+        self._start_time = time.time()
+        super().start()
+        
+    def _tick(self):
+        w1, w2, w3 = self._waves
+        out = self._out
+        
+        elapsed = time.time() - self._start_time
+        remaining = max(0, self.duration - elapsed)
+        
+        # Generate dynamic waveform, normalized to 0-8 range
+        _wave_indices((w1.sin, w2.sin, w3.sin), (0.4, 0.3, 0.3), 1, 4, 8, out)
+        waveform = b"".join(map(self._blocks.__getitem__, out))
+        
+        # Progress bar
+        progress = min(1.0, elapsed / self.duration)
+        prog_width = 10
+        filled = int(prog_width * progress)
+        prog_bar = f"[{'=' * filled}{' ' * (prog_width - filled)}]"
+        
+        self._write_frame(
+            self._pre + waveform + self._mid
+            + _encode(f"{remaining:.1f}s {prog_bar}") + self._suf
+        )
+        
+        w1.advance()
+        w2.advance()
+        w3.advance()
 
 
 class ThinkingAnimation(AnimatedState):
     """Neural network-style thinking animation."""
     
+    interval = 0.08
+    
+    _SPINNERS = "/-\\|"
+    
     def __init__(self, message: str = "PROCESSING"):
         super().__init__(message, Colors.MAGENTA)
         self.width = 30
+        self._phase = 0
         
-    def _animate(self):
         # Neural pattern characters
-        patterns = [".", "o", "O", "0", "@", "#"]
-        phase = 0
-        
-        while not self._stop_event.is_set():
-            # Create flowing neural pattern
-            neural = []
-            for i in range(self.width):
-                val = math.sin((i * 0.4) + phase) + math.sin((i * 0.2) + phase * 1.5)
-                idx = int((val + 2) * len(patterns) / 4)
-                idx = max(0, min(len(patterns) - 1, idx))
-                neural.append(patterns[idx])
-            
-            pattern = "".join(neural)
-            
-            # Spinner
-            spinners = ["/-\\|", "    "][0]
-            spinner = spinners[int(phase * 2) % len(spinners)]
-            
-            # Dots animation
-            dots = "." * (int(phase) % 4)
-            
-            output = (
-                f"\r{Colors.MAGENTA}{Colors.BOLD}[{spinner}] {self.message}{dots:<3} "
-                f"{Colors.RESET}{Colors.MAGENTA}{Colors.DIM}{pattern}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 0.2
-            time.sleep(0.08)
+        self._patterns = _encode_cells(".oO0@#")
+        
+        # Phase advances 0.2/frame
+        self._waves = (
+            _SineBank(self.width, 0.4, 1.0, 0.2),
+            _SineBank(self.width, 0.2, 1.5, 0.2),
+        )
+        self._out = [0] * self.width
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{Colors.MAGENTA}{Colors.BOLD}[")
+        self._mid = _encode(f"] {self.message}")
+        self._mid2 = _encode(f" {Colors.RESET}{Colors.MAGENTA}{Colors.DIM}")
+        self._suf = _encode(Colors.RESET)
+        
+    def _tick(self):
+        patterns = self._patterns
+        w1, w2 = self._waves
+        out = self._out
+        phase = self._phase
+        
+        # Create flowing neural pattern
+        _wave_indices((w1.sin, w2.sin), (1.0, 1.0), 2, len(patterns) / 4, len(patterns) - 1, out)
+        pattern = b"".join(map(patterns.__getitem__, out))
+        
+        # Spinner
+        spinner = self._SPINNERS[int(phase * 2) % 4]
+        
+        # Dots animation
+        dots = "." * (int(phase) % 4)
+        
+        self._write_frame(
+            self._pre + _encode(spinner) + self._mid + _encode(f"{dots:<3}")
+            + self._mid2 + pattern + self._suf
+        )
+        
+        self._phase = phase + 0.2
+        w1.advance()
+        w2.advance()
 
 
 class GeneratingAnimation(AnimatedState):
     """Text generation animation with typing effect indicator."""
     
+    interval = 0.06
+    
     def __init__(self, message: str = "GENERATING"):
         super().__init__(message, Colors.GREEN)
         self.width = 25
+        self._phase = 0
+        
+        # Phase advances 0.15/frame
+        self._wave = _SineBank(self.width, 0.5, 1.0, 0.15)
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{Colors.GREEN}{Colors.BOLD}>> {self.message} {Colors.RESET}{Colors.GREEN}[")
+        self._suf = _encode(f"]_{Colors.RESET}"), _encode(f"] {Colors.RESET}")
         
-    def _animate(self):
-        phase = 0
+    def _tick(self):
+        phase = self._phase
         
         # Matrix-style characters
         chars = "01"
         
-        while not self._stop_event.is_set():
-            # Generate matrix rain effect
-            matrix = []
-            for i in range(self.width):
-                intensity = math.sin((i * 0.5) + phase) + 1
-                if intensity > 1.5:
-                    matrix.append(chars[int(phase * 3 + i) % 2])
-                elif intensity > 0.8:
-                    matrix.append(Colors.DIM + chars[int(phase * 2 + i) % 2] + Colors.RESET + Colors.GREEN)
-                else:
-                    matrix.append(" ")
-            
-            stream = "".join(matrix)
-            
-            # Cursor blink
-            cursor = "_" if int(phase * 3) % 2 == 0 else " "
-            
-            output = (
-                f"\r{Colors.GREEN}{Colors.BOLD}>> {self.message} "
-                f"{Colors.RESET}{Colors.GREEN}[{stream}]{cursor}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 0.15
-            time.sleep(0.06)
+        # Generate matrix rain effect
+        matrix = []
+        for i, val in enumerate(self._wave.sin):
+            intensity = val + 1
+            if intensity > 1.5:
+                matrix.append(chars[int(phase * 3 + i) % 2])
+            elif intensity > 0.8:
+                matrix.append(Colors.DIM + chars[int(phase * 2 + i) % 2] + Colors.RESET + Colors.GREEN)
+            else:
+                matrix.append(" ")
+        
+        stream = "".join(matrix)
+        
+        # Cursor blink
+        suffix = self._suf[int(phase * 3) % 2]
+        
+        self._write_frame(self._pre + _encode(stream) + suffix)
+        
+        self._phase = phase + 0.15
+        self._wave.advance()
 
 
 class SpeakingAnimation(AnimatedState):
     """Audio output waveform animation."""
     
+    interval = 0.04
+    
     def __init__(self):
         super().__init__("SPEAKING", Colors.YELLOW)
         self.width = 35
+        self._blocks = _encode_cells(" ▁▂▃▄▅▆▇█")
+        
+        # Volume pulse is sin(phase * 2), phase advancing 0.12/frame
+        self._vol_idx = 0
+        self._vol_step = _phase_step(0.12 * 2)
+        
+        # More aggressive waveform for speaking (phase advances 0.12/frame)
+        self._waves = (
+            _SineBank(self.width, 0.4, 2.0, 0.12),
+            _SineBank(self.width, 0.6, 1.5, 0.12),
+            _SineBank(self.width, 0.2, 3.0, 0.12),
+        )
+        self._out = [0] * self.width
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{Colors.YELLOW}{Colors.BOLD}<< {self.message} {Colors.RESET}{Colors.YELLOW}")
+        self._mid = _encode(f" {Colors.DIM}[")
+        self._suf = _encode(f"]{Colors.RESET}")
+        
+    def _tick(self):
+        w1, w2, w3 = self._waves
+        out = self._out
+        
+        # Generate audio visualization
+        _wave_indices((w1.sin, w2.cos, w3.sin), (0.5, 0.3, 0.2), 1, 4, 8, out)
+        waveform = b"".join(map(self._blocks.__getitem__, out))
         
-    def _animate(self):
-        phase = 0
-        blocks = " ▁▂▃▄▅▆▇█"
-        
-        while not self._stop_event.is_set():
-            # Generate audio visualization
-            wave = []
-            for i in range(self.width):
-                # More aggressive waveform for speaking
-                val = (
-                    math.sin((i * 0.4) + phase * 2) * 0.5 +
-                    math.cos((i * 0.6) + phase * 1.5) * 0.3 +
-                    math.sin((i * 0.2) + phase * 3) * 0.2
-                )
-                idx = int((val + 1) * 4)
-                idx = max(0, min(8, idx))
-                wave.append(blocks[idx])
-            
-            waveform = "".join(wave)
-            
-            # Volume indicator
-            vol_phase = (math.sin(phase * 2) + 1) / 2
-            vol_bars = int(vol_phase * 5)
-            volume = "|" * vol_bars + " " * (5 - vol_bars)
-            
-            output = (
-                f"\r{Colors.YELLOW}{Colors.BOLD}<< {self.message} "
-                f"{Colors.RESET}{Colors.YELLOW}{waveform} "
-                f"{Colors.DIM}[{volume}]{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 0.12
-            time.sleep(0.04)
+        # Volume indicator
+        vol_phase = (_SIN_TABLE[self._vol_idx & _SIN_MASK] + 1) / 2
+        vol_bars = int(vol_phase * 5)
+        volume = "|" * vol_bars + " " * (5 - vol_bars)
+        
+        self._write_frame(self._pre + waveform + self._mid + _encode(volume) + self._suf)
+        
+        self._vol_idx += self._vol_step
+        w1.advance()
+        w2.advance()
+        w3.advance()
 
 
 class LoadingAnimation(AnimatedState):
     """Smooth progress bar with status updates."""
     
+    interval = 0.1
+    
+    # Spinner characters
+    _SPINNERS = (
+        "    ",
+        ".   ",
+        "..  ",
+        "... ",
+        " ...",
+        "  ..",
+        "   .",
+    )
+    
     def __init__(self, message: str = "LOADING"):
         super().__init__(message, Colors.BLUE)
         self._progress = 0
         self._status = ""
         self.width = 40
+        self._phase = 0
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{Colors.BLUE}{Colors.BOLD}[")
+        self._mid = _encode(f"] {self.message} {Colors.RESET}{Colors.BLUE}[")
+        self._mid2 = _encode(f"] {Colors.BOLD}")
+        self._mid3 = _encode(Colors.DIM)
+        self._suf = _encode(Colors.RESET)
+        
+        # Last rendered bar and percentage, reused until progress changes
+        self._bar_progress = None
+        self._bar = b""
         
     def set_progress(self, progress: int, status: str = ""):
         """Update progress (0-100) and status message."""
         self._progress = min(100, max(0, progress))
         self._status = status
     
-    def _animate(self):
-        # Spinner characters
-        spinners = [
-            "    ",
-            ".   ",
-            "..  ",
-            "... ",
-            " ...",
-            "  ..",
-            "   .",
-        ]
+    def _tick(self):
+        spinner = self._SPINNERS[int(self._phase) % 7]
         
-        phase = 0
-        
-        while not self._stop_event.is_set():
-            spinner = spinners[int(phase) % len(spinners)]
-            
-            # Smooth progress bar with gradient effect
-            filled = int(self.width * self._progress / 100)
-            
-            # Create gradient bar
-            bar_chars = []
-            for i in range(self.width):
-                if i < filled:
-                    bar_chars.append("=")
-                elif i == filled and self._progress < 100:
-                    bar_chars.append(">")
-                else:
-                    bar_chars.append("-")
-            
-            bar = "".join(bar_chars)
-            
-            status_text = f" {self._status}" if self._status else ""
-            
-            output = (
-                f"\r{Colors.BLUE}{Colors.BOLD}[{spinner}] {self.message} "
-                f"{Colors.RESET}{Colors.BLUE}[{bar}] "
-                f"{Colors.BOLD}{self._progress:3d}%{Colors.DIM}{status_text}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 0.3
-            time.sleep(0.1)
+        # Smooth progress bar with gradient effect, rebuilt only on change
+        progress = self._progress
+        if progress != self._bar_progress:
+            filled = int(self.width * progress / 100)
+            head = ">" if progress < 100 else ""
+            bar = "=" * filled + head + "-" * (self.width - filled - len(head))
+            self._bar = _encode(bar) + self._mid2 + _encode(f"{progress:3d}%")
+            self._bar_progress = progress
+        
+        status_text = f" {self._status}" if self._status else ""
+        
+        self._write_frame(
+            self._pre + _encode(spinner) + self._mid + self._bar
+            + self._mid3 + _encode(status_text) + self._suf
+        )
+        
+        self._phase += 0.3
 
 
 
 class WaitingForInput(AnimatedState):
     """Pulsing ready indicator."""
     
+    interval = 0.15
+    
+    # Pulsing arrow states
+    _ARROWS = (
+        "  > ",
+        " >> ",
+        ">>> ",
+        ">>>>",
+        ">>> ",
+        " >> ",
+        "  > ",
+        "    ",
+    )
+    
     def __init__(self):
         super().__init__("READY", Colors.GREEN)
+        self._phase = 0
         
-    def _animate(self):
-        phase = 0
-        
-        # Pulsing arrow states
-        arrows = [
-            "  > ",
-            " >> ",
-            ">>> ",
-            ">>>>",
-            ">>> ",
-            " >> ",
-            "  > ",
-            "    ",
-        ]
+        # Static parts of the frame, encoded once (bold and normal)
+        self._pre = _encode(f"\r{Colors.GREEN}{Colors.BOLD}"), _encode(f"\r{Colors.GREEN}")
+        self._mid = _encode(" Press ENTER to speak ")
+        self._suf = _encode(Colors.RESET)
         
-        while not self._stop_event.is_set():
-            arrow = arrows[int(phase) % len(arrows)]
-            
-            # Pulsing brightness
-            if int(phase) % 8 < 4:
-                style = Colors.BOLD
-            else:
-                style = ""
-            
-            output = (
-                f"\r{Colors.GREEN}{style}{arrow} "
-                f"Press ENTER to speak {arrow[::-1]}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            phase += 1
-            time.sleep(0.15)
+    def _tick(self):
+        phase = self._phase
+        arrow = self._ARROWS[phase % 8]
+        
+        # Pulsing brightness
+        prefix = self._pre[0] if phase % 8 < 4 else self._pre[1]
+        
+        self._write_frame(prefix + _encode(arrow) + self._mid + _encode(arrow[::-1]) + self._suf)
+        
+        self._phase = phase + 1
 
 
 
@@ -375,11 +527,12 @@ class WaitingForInput(AnimatedState):
 class PulseAnimation(AnimatedState):
     """Simple pulsing dot animation for any state."""
     
+    interval = 0.12
+    
     def __init__(self, message: str, color: str = Colors.WHITE):
         super().__init__(message, color)
-        
-    def _animate(self):
-        pulse_frames = [
+        self._frame_idx = 0
+        self._frames = [
             "(   )",
             "(.  )",
             "(.. )",
@@ -388,20 +541,17 @@ class PulseAnimation(AnimatedState):
             "(  .)",
             "(   )",
         ]
-        frame_idx = 0
-        
-        while not self._stop_event.is_set():
-            frame = pulse_frames[frame_idx % len(pulse_frames)]
-            
-            output = (
-                f"\r{self.color}{Colors.BOLD}{frame} {self.message}{Colors.RESET}"
-            )
-            
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            frame_idx += 1
-            time.sleep(0.12)
+        
+        # Static parts of the frame, encoded once
+        self._pre = _encode(f"\r{self.color}{Colors.BOLD}")
+        self._suf = _encode(f" {self.message}{Colors.RESET}")
+        
+    def _tick(self):
+        frame = self._frames[self._frame_idx % len(self._frames)]
+        
+        self._write_frame(self._pre + _encode(frame) + self._suf)
+        
+        self._frame_idx += 1
 
 
 # Context managers for easy use
@@ -460,9 +610,17 @@ def loading(message: str = "LOADING"):
         anim.stop()
 
 
-def print_banner():
-    """Print a stylish ASCII startup banner."""
-    banner = f"""
+# Static text is rendered once; escapes are dropped when stdout is not a terminal
+_IS_TTY = sys.stdout.isatty()
+_ANSI_RE = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences from text."""
+    return _ANSI_RE.sub("", text)
+
+
+_BANNER_TTY = f"""
 {Colors.CYAN}{Colors.BOLD}
     ╔═══════════════════════════════════════════════════════════════╗
     ║                                                               ║
@@ -477,43 +635,65 @@ def print_banner():
     ║                                                               ║
     ╚═══════════════════════════════════════════════════════════════╝
 {Colors.RESET}"""
-    print(banner)
+_BANNER_PLAIN = _strip_ansi(_BANNER_TTY)
+
+_SEPARATOR_TTY = f"\n{Colors.DIM}{'─' * 65}{Colors.RESET}\n"
+_SEPARATOR_PLAIN = _strip_ansi(_SEPARATOR_TTY)
+
+# Filled in with str.format(record_duration=...)
+_INSTRUCTIONS_TTY = f"""
+{Colors.CYAN}{Colors.BOLD}INSTRUCTIONS{Colors.RESET}
+{Colors.DIM}{'─' * 40}{Colors.RESET}
+  {Colors.WHITE}>{Colors.RESET} Press {Colors.BOLD}ENTER{Colors.RESET} to record (up to {{record_duration}}s)
+  {Colors.WHITE}>{Colors.RESET} Speak clearly, then pause to finish
+  {Colors.WHITE}>{Colors.RESET} AI responds with voice + text
+  {Colors.WHITE}>{Colors.RESET} Press {Colors.BOLD}ENTER{Colors.RESET} mid-reply to interrupt
+  {Colors.WHITE}>{Colors.RESET} Press {Colors.BOLD}CTRL+C{Colors.RESET} to exit
+{Colors.DIM}{'─' * 40}{Colors.RESET}
+"""
+_INSTRUCTIONS_PLAIN = _strip_ansi(_INSTRUCTIONS_TTY)
+
+
+def print_banner():
+    """Print a stylish ASCII startup banner."""
+    print(_BANNER_TTY if _IS_TTY else _BANNER_PLAIN)
+
+
+_STATUS_ICONS = {
+    "info": f"{Colors.BLUE}[i]{Colors.RESET}",
+    "success": f"{Colors.GREEN}[+]{Colors.RESET}",
+    "warning": f"{Colors.YELLOW}[!]{Colors.RESET}",
+    "error": f"{Colors.RED}[x]{Colors.RESET}",
+    "audio": f"{Colors.CYAN}[~]{Colors.RESET}",
+}
+if not _IS_TTY:
+    _STATUS_ICONS = {status: _strip_ansi(icon) for status, icon in _STATUS_ICONS.items()}
+
+_RESPONSE_HEADER = f"\n{Colors.MAGENTA}{Colors.BOLD}>> ASSISTANT:{Colors.RESET} "
+if not _IS_TTY:
+    _RESPONSE_HEADER = _strip_ansi(_RESPONSE_HEADER)
 
 
 def print_status(message: str, status: str = "info"):
     """Print a styled status message."""
-    icons = {
-        "info": f"{Colors.BLUE}[i]{Colors.RESET}",
-        "success": f"{Colors.GREEN}[+]{Colors.RESET}",
-        "warning": f"{Colors.YELLOW}[!]{Colors.RESET}",
-        "error": f"{Colors.RED}[x]{Colors.RESET}",
-        "audio": f"{Colors.CYAN}[~]{Colors.RESET}",
-    }
-    icon = icons.get(status, icons["info"])
+    icon = _STATUS_ICONS.get(status, _STATUS_ICONS["info"])
     print(f" {icon} {message}")
 
 
 def print_response_header():
     """Print header for AI response."""
-    print(f"\n{Colors.MAGENTA}{Colors.BOLD}>> ASSISTANT:{Colors.RESET} ", end="", flush=True)
+    print(_RESPONSE_HEADER, end="", flush=True)
 
 
 def print_separator():
     """Print a visual separator."""
-    print(f"\n{Colors.DIM}{'─' * 65}{Colors.RESET}\n")
+    print(_SEPARATOR_TTY if _IS_TTY else _SEPARATOR_PLAIN)
 
 
 def print_instructions(record_duration: int = 5):
     """Print usage instructions."""
-    print(f"""
-{Colors.CYAN}{Colors.BOLD}INSTRUCTIONS{Colors.RESET}
-{Colors.DIM}{'─' * 40}{Colors.RESET}
-  {Colors.WHITE}>{Colors.RESET} Press {Colors.BOLD}ENTER{Colors.RESET} to record ({record_duration}s)
-  {Colors.WHITE}>{Colors.RESET} Speak clearly into microphone
-  {Colors.WHITE}>{Colors.RESET} AI responds with voice + text
-  {Colors.WHITE}>{Colors.RESET} Press {Colors.BOLD}CTRL+C{Colors.RESET} to exit
-{Colors.DIM}{'─' * 40}{Colors.RESET}
-""")
+    template = _INSTRUCTIONS_TTY if _IS_TTY else _INSTRUCTIONS_PLAIN
+    print(template.format(record_duration=record_duration))
 
 
 
@@ -4,22 +4,67 @@ Automatic Model Downloader for Local-Assistant.
 Downloads required models if they don't exist.
 """
 
+import codecs
 import os
 import sys
 import subprocess
+import time
 import urllib.request
+import concurrent.futures
+import threading
 import shutil
+from collections import namedtuple
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+def _enable_hf_transfer():
+    """Turn on the parallel hf_transfer backend if it is installed.
+
+    Must run before huggingface_hub is imported, since the hub reads the
+    setting once at import time.
+    """
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return False
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    return True
+
+
+_enable_hf_transfer()
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MODELS_DIR = os.path.join(SCRIPT_DIR, "models")
 
+# Streaming download settings
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB socket reads and file writes
+PROGRESS_INTERVAL = 0.25  # Seconds between progress line updates
+DOWNLOAD_TIMEOUT = 30  # Seconds to wait for a connection or a stalled read
+HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host
+HTTP_RETRIES = 3  # Retries for connection errors and 429/5xx responses
+HF_MAX_WORKERS = 8  # Parallel file downloads for Hugging Face snapshots
+
+# Files smaller than this fraction of their expected size are treated as
+# interrupted downloads
+MIN_SIZE_RATIO = 0.9
+
+# Written after a fully successful check; while it is newer than every model
+# file, startup skips the per-model checks
+READY_SENTINEL = os.path.join(MODELS_DIR, ".models_ready")
+
 # Model configurations
 MODELS_CONFIG = {
     "llama-3.2-3b-instruct": {
         "type": "gguf",
         "repo_id": "bartowski/Llama-3.2-3B-Instruct-GGUF",
         "filename": "Llama-3.2-3B-Instruct-Q4_K_M.gguf",
+        "expected_size_bytes": 2_019_377_696,
         "description": "Llama-3.2-3B-Instruct - Lightweight LLM optimized for tool calling"
     },
     "piper": {
@@ -28,6 +73,7 @@ MODELS_CONFIG = {
         "config_url": "https://huggingface.co/rhasspy/piper-voices/resolve/main/en/en_US/amy/medium/en_US-amy-medium.onnx.json",
         "model_file": "en_US-amy-medium.onnx",
         "config_file": "en_US-amy-medium.onnx.json",
+        "expected_size_bytes": 63_201_294,  # ONNX model file
         "description": "Piper TTS - Text-to-speech model"
     },
     "kokoro": {
@@ -37,41 +83,185 @@ MODELS_CONFIG = {
     }
 }
 
+# Per-model facts derived from MODELS_CONFIG once, so checks don't redo the
+# dict lookups and path joins on every call
+_ModelEntry = namedtuple(
+    "_ModelEntry",
+    "name type model_dir required_files required_paths expected_size description",
+)
+
+
+def _plan_entry(name: str, config: dict) -> _ModelEntry:
+    """Precompute the directory and required file paths for one model."""
+    model_type = config.get("type")
+    if model_type == "gguf":
+        required_files = (config.get("filename", ""),)
+    elif model_type == "piper":
+        required_files = (config.get("model_file", ""), config.get("config_file", ""))
+    else:
+        required_files = tuple(config.get("required_files", ()))
+    model_dir = os.path.join(MODELS_DIR, name)
+    return _ModelEntry(
+        name=name,
+        type=model_type,
+        model_dir=model_dir,
+        required_files=required_files,
+        required_paths=tuple(os.path.join(model_dir, f) for f in required_files),
+        expected_size=config.get("expected_size_bytes", 0),  # First required file
+        description=config.get("description", ""),
+    )
+
+
+_MODEL_PLAN = {name: _plan_entry(name, config) for name, config in MODELS_CONFIG.items()}
+
+
+_STATUS_COLORS = {
+    "info": "\033[94m",      # Blue
+    "success": "\033[92m",   # Green
+    "warning": "\033[93m",   # Yellow
+    "error": "\033[91m",     # Red
+    "download": "\033[96m",  # Cyan
+}
+_RESET = "\033[0m"
+
+# Leave out color codes when output goes to a log file or pipe
+_USE_COLOR = sys.stdout.isatty()
+if not _USE_COLOR:
+    _STATUS_COLORS = {}
+    _RESET = ""
+
+_ICONS_UTF8 = {
+    "info": "ℹ️ ",
+    "success": "✅",
+    "warning": "⚠️ ",
+    "error": "❌",
+    "download": "⬇️ ",
+}
+# Same style as cli_animations.print_status
+_ICONS_ASCII = {
+    "info": "[i]",
+    "success": "[+]",
+    "warning": "[!]",
+    "error": "[x]",
+    "download": "[v]",
+}
+
+
+def _stdout_is_utf8() -> bool:
+    """Check whether stdout can encode the emoji status icons."""
+    try:
+        return codecs.lookup(sys.stdout.encoding or "").name == "utf-8"
+    except (AttributeError, LookupError):
+        return False
+
+
+# Emoji crash consoles like cp1252, so pick the icon set once at import
+_ICONS = _ICONS_UTF8 if _stdout_is_utf8() else _ICONS_ASCII
+_MARK_OK, _MARK_MISSING = ("✓", "✗") if _ICONS is _ICONS_UTF8 else ("ok", "--")
+
+
+# Serializes status and progress lines from parallel downloads
+_PRINT_LOCK = threading.Lock()
+_progress_line_open = False
 
 
 def print_status(message, status_type="info"):
     """Print colored status messages."""
-    colors = {
-        "info": "\033[94m",      # Blue
-        "success": "\033[92m",   # Green
-        "warning": "\033[93m",   # Yellow
-        "error": "\033[91m",     # Red
-        "download": "\033[96m",  # Cyan
-    }
-    reset = "\033[0m"
-    icons = {
-        "info": "ℹ️ ",
-        "success": "✅",
-        "warning": "⚠️ ",
-        "error": "❌",
-        "download": "⬇️ ",
-    }
-    color = colors.get(status_type, "")
-    icon = icons.get(status_type, "")
-    print(f"{color}{icon} {message}{reset}")
+    global _progress_line_open
+    with _PRINT_LOCK:
+        if _progress_line_open:
+            print()  # End the progress line instead of appending to it
+            _progress_line_open = False
+        print(f"{_STATUS_COLORS.get(status_type, '')}{_ICONS.get(status_type, '')} {message}{_RESET}")
+
+
+def _print_progress(text: str):
+    """Redraw the in-place progress line."""
+    global _progress_line_open
+    with _PRINT_LOCK:
+        print(f"\r{text}", end="", flush=True)
+        _progress_line_open = True
+
+
+# Memoized probes - filled in on first use
+_HF_HUB = None
+_HF_CLI_AVAILABLE = None
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+_MODELS_READY = False
+
+
+def _get_hf_hub():
+    """Import huggingface_hub once and reuse it. Returns None if not installed."""
+    global _HF_HUB
+    if _HF_HUB is None:
+        try:
+            import huggingface_hub
+        except ImportError:
+            return None
+        _HF_HUB = huggingface_hub
+    return _HF_HUB
+
+
+def _get_http_session():
+    """Create one pooled keep-alive requests session and reuse it."""
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            _HTTP_SESSION = _new_http_session()
+    return _HTTP_SESSION
+
+
+def _new_http_session():
+    """Build a requests session with connection pooling and retries."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _install_huggingface_hub():
+    """Install huggingface_hub, plus hf_transfer where the platform supports it."""
+    subprocess.run([sys.executable, "-m", "pip", "install", "huggingface_hub"], 
+                  check=True, capture_output=True)
+    # Optional accelerator - no wheels on some platforms, so failure is fine
+    subprocess.run([sys.executable, "-m", "pip", "install", "hf_transfer"], 
+                  capture_output=True)
+    _enable_hf_transfer()
+    hf_hub = _get_hf_hub()
+    if hf_hub is None:
+        raise ImportError("huggingface_hub is still unavailable after install")
+    return hf_hub
 
 
 def check_huggingface_cli():
-    """Check if huggingface-cli is available."""
-    try:
-        result = subprocess.run(
-            ["huggingface-cli", "--version"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if huggingface-cli is available (probed once per process)."""
+    global _HF_CLI_AVAILABLE
+    if _HF_CLI_AVAILABLE is None:
+        try:
+            result = subprocess.run(
+                ["huggingface-cli", "--version"],
+                capture_output=True,
+                text=True
+            )
+            _HF_CLI_AVAILABLE = result.returncode == 0
+        except FileNotFoundError:
+            _HF_CLI_AVAILABLE = False
+    return _HF_CLI_AVAILABLE
 
 
 def download_huggingface_model(repo_id: str, target_dir: str, model_name: str):
@@ -84,30 +274,31 @@ def download_huggingface_model(repo_id: str, target_dir: str, model_name: str):
     os.makedirs(target_dir, exist_ok=True)
     
     # Method 1: Use huggingface_hub Python library (preferred)
-    try:
-        from huggingface_hub import snapshot_download
-        
-        print_status("Using huggingface_hub for download...", "info")
-        snapshot_download(
-            repo_id=repo_id,
-            local_dir=target_dir,
-            local_dir_use_symlinks=False,
-            resume_download=True
-        )
-        print_status(f"Successfully downloaded {model_name}!", "success")
-        return True
-        
-    except ImportError:
+    hf_hub = _get_hf_hub()
+    if hf_hub is None:
         print_status("huggingface_hub not found, trying CLI...", "warning")
-    except Exception as e:
-        print_status(f"huggingface_hub error: {e}", "warning")
-        print_status("Trying CLI method...", "info")
+    else:
+        try:
+            print_status("Using huggingface_hub for download...", "info")
+            hf_hub.snapshot_download(
+                repo_id=repo_id,
+                local_dir=target_dir,
+                local_dir_use_symlinks=False,
+                resume_download=True,
+                max_workers=HF_MAX_WORKERS
+            )
+            print_status(f"Successfully downloaded {model_name}!", "success")
+            return True
+        except Exception as e:
+            print_status(f"huggingface_hub error: {e}", "warning")
+            print_status("Trying CLI method...", "info")
     
     # Method 2: Use huggingface-cli
     if check_huggingface_cli():
         try:
             result = subprocess.run(
-                ["huggingface-cli", "download", repo_id, "--local-dir", target_dir],
+                ["huggingface-cli", "download", repo_id, "--local-dir", target_dir,
+                 "--max-workers", str(HF_MAX_WORKERS)],
                 capture_output=True,
                 text=True
             )
@@ -122,15 +313,13 @@ def download_huggingface_model(repo_id: str, target_dir: str, model_name: str):
     # Method 3: Install huggingface_hub and retry
     print_status("Installing huggingface_hub...", "info")
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "huggingface_hub"], 
-                      check=True, capture_output=True)
-        
-        from huggingface_hub import snapshot_download
-        snapshot_download(
+        hf_hub = _install_huggingface_hub()
+        hf_hub.snapshot_download(
             repo_id=repo_id,
             local_dir=target_dir,
             local_dir_use_symlinks=False,
-            resume_download=True
+            resume_download=True,
+            max_workers=HF_MAX_WORKERS
         )
         print_status(f"Successfully downloaded {model_name}!", "success")
         return True
@@ -140,25 +329,59 @@ def download_huggingface_model(repo_id: str, target_dir: str, model_name: str):
         return False
 
 
-def download_file(url: str, destination: str, description: str = "file"):
+@contextmanager
+def _open_download(url: str):
+    """Open a streaming HTTP response. Yields (readable, total_size).
+
+    Uses requests when it is installed and falls back to urllib otherwise;
+    both readables support readinto() so the copy loop is shared.
+    """
+    if requests is not None:
+        with _get_http_session().get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield response.raw, int(response.headers.get("Content-Length") or 0)
+    else:
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            yield response, int(response.headers.get("Content-Length") or 0)
+
+
+def download_file(url: str, destination: str, description: str = "file", show_progress: bool = True):
     """Download a file with progress indication."""
     print_status(f"Downloading {description}...", "download")
     print_status(f"URL: {url}", "info")
     
     os.makedirs(os.path.dirname(destination), exist_ok=True)
     
+    def report_progress(downloaded, total_size):
+        if show_progress and total_size > 0:
+            percent = min(100, (downloaded / total_size) * 100)
+            mb_downloaded = downloaded / (1024 * 1024)
+            mb_total = total_size / (1024 * 1024)
+            _print_progress(f"  Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)")
+    
     try:
-        # Use urllib with progress
-        def report_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            if total_size > 0:
-                percent = min(100, (downloaded / total_size) * 100)
-                mb_downloaded = downloaded / (1024 * 1024)
-                mb_total = total_size / (1024 * 1024)
-                print(f"\r  Progress: {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end="", flush=True)
-        
-        urllib.request.urlretrieve(url, destination, report_progress)
-        print()  # New line after progress
+        # Stream in large chunks, updating progress a few times per second
+        with _open_download(url) as (response, total_size), \
+                open(destination, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as out:
+            buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+            view = memoryview(buf)
+            downloaded = 0
+            last_report = 0.0
+            
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                out.write(view[:n])
+                downloaded += n
+                
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    report_progress(downloaded, total_size)
+                    last_report = now
+            
+            report_progress(downloaded, total_size)
         print_status(f"Downloaded: {os.path.basename(destination)}", "success")
         return True
         
@@ -167,6 +390,43 @@ def download_file(url: str, destination: str, description: str = "file"):
         return False
 
 
+def _is_complete(path: str, expected_size: int = 0) -> bool:
+    """Check that a file exists and is not a truncated partial download."""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return False
+    if expected_size:
+        return size >= expected_size * MIN_SIZE_RATIO
+    return size > 0
+
+
+# Directory path -> (mtime_ns, entry names) from its last scan
+_DIR_SCAN_CACHE = {}
+
+
+def _scan_dir(path: str):
+    """List a directory's entry names in one pass. Returns None if missing.
+
+    The result is reused while the directory's mtime is unchanged, i.e.
+    until an entry is added, removed or renamed.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _DIR_SCAN_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(path) as it:
+            names = frozenset(entry.name for entry in it)
+    except OSError:
+        return None
+    _DIR_SCAN_CACHE[path] = (mtime, names)
+    return names
+
+
 def download_piper_model(target_dir: str):
     """Download Piper TTS model files."""
     config = MODELS_CONFIG["piper"]
@@ -177,55 +437,63 @@ def download_piper_model(target_dir: str):
     model_path = os.path.join(target_dir, config["model_file"])
     config_path = os.path.join(target_dir, config["config_file"])
     
-    success = True
-    
-    # Download model file
-    if not os.path.exists(model_path):
-        if not download_file(config["model_url"], model_path, "Piper ONNX model"):
-            success = False
-    else:
+    # (url, destination, description) for each missing file
+    missing = []
+    if _is_complete(model_path, config.get("expected_size_bytes", 0)):
         print_status(f"Model file already exists: {config['model_file']}", "info")
-    
-    # Download config file
-    if not os.path.exists(config_path):
-        if not download_file(config["config_url"], config_path, "Piper config"):
-            success = False
     else:
+        missing.append((config["model_url"], model_path, "Piper ONNX model"))
+    if _is_complete(config_path):
         print_status(f"Config file already exists: {config['config_file']}", "info")
+    else:
+        missing.append((config["config_url"], config_path, "Piper config"))
     
-    return success
+    # Fetch the files concurrently; only the first (largest) shows live
+    # progress so the carriage-return progress lines don't interleave
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(download_file, url, dest, desc, show_progress=(i == 0))
+            for i, (url, dest, desc) in enumerate(missing)
+        ]
+        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+    
+    return all(results)
 
 
 def check_model_exists(model_name: str) -> bool:
     """Check if a model exists and has required files."""
-    config = MODELS_CONFIG.get(model_name, {})
+    entry = _MODEL_PLAN.get(model_name) or _plan_entry(model_name, {})
     
     # For GGUF models, check if the single .gguf file exists
-    if config.get("type") == "gguf":
-        model_path = os.path.join(MODELS_DIR, model_name, config.get("filename", ""))
-        return os.path.exists(model_path)
+    if entry.type == "gguf":
+        return _is_complete(entry.required_paths[0], entry.expected_size)
     
-    model_dir = os.path.join(MODELS_DIR, model_name)
+    if entry.type not in ("huggingface", "piper"):
+        # If directory exists but no config, assume it's valid
+        try:
+            with os.scandir(entry.model_dir) as it:
+                return next(it, None) is not None
+        except OSError:
+            return False
     
-    if not os.path.exists(model_dir):
+    # One directory read instead of a stat per required file
+    names = _scan_dir(entry.model_dir)
+    if names is None:
         return False
     
     # For Hugging Face models, check for required files
-    if config.get("type") == "huggingface":
-        required_files = config.get("required_files", [])
-        for req_file in required_files:
-            if not os.path.exists(os.path.join(model_dir, req_file)):
-                return False
-        return True
-    
-    # For Piper, check for ONNX and JSON files
-    if config.get("type") == "piper":
-        model_file = os.path.join(model_dir, config.get("model_file", ""))
-        config_file = os.path.join(model_dir, config.get("config_file", ""))
-        return os.path.exists(model_file) and os.path.exists(config_file)
+    if entry.type == "huggingface":
+        return all(
+            req_file in names or ("/" in req_file and os.path.exists(req_path))
+            for req_file, req_path in zip(entry.required_files, entry.required_paths)
+        )
     
-    # If directory exists but no config, assume it's valid
-    return len(os.listdir(model_dir)) > 0
+    # For Piper, check for ONNX and JSON files; sizes are always re-read
+    # since a growing download doesn't change the directory mtime
+    if not all(req_file in names for req_file in entry.required_files):
+        return False
+    model_path, config_path = entry.required_paths
+    return _is_complete(model_path, entry.expected_size) and _is_complete(config_path)
 
 
 def download_gguf_model(repo_id: str, filename: str, target_dir: str, model_name: str) -> bool:
@@ -238,9 +506,12 @@ def download_gguf_model(repo_id: str, filename: str, target_dir: str, model_name
     target_path = os.path.join(target_dir, filename)
     
     try:
-        from huggingface_hub import hf_hub_download
+        hf_hub = _get_hf_hub()
+        if hf_hub is None:
+            print_status("huggingface_hub not installed. Installing...", "warning")
+            hf_hub = _install_huggingface_hub()
         
-        hf_hub_download(
+        hf_hub.hf_hub_download(
             repo_id=repo_id,
             filename=filename,
             local_dir=target_dir,
@@ -250,24 +521,6 @@ def download_gguf_model(repo_id: str, filename: str, target_dir: str, model_name
         print_status(f"Successfully downloaded {model_name}!", "success")
         return True
         
-    except ImportError:
-        print_status("huggingface_hub not installed. Installing...", "warning")
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "huggingface_hub"], 
-                          check=True, capture_output=True)
-            from huggingface_hub import hf_hub_download
-            hf_hub_download(
-                repo_id=repo_id,
-                filename=filename,
-                local_dir=target_dir,
-                local_dir_use_symlinks=False,
-                resume_download=True
-            )
-            print_status(f"Successfully downloaded {model_name}!", "success")
-            return True
-        except Exception as e:
-            print_status(f"Failed to download {model_name}: {e}", "error")
-            return False
     except Exception as e:
         print_status(f"Failed to download {model_name}: {e}", "error")
         return False
@@ -285,35 +538,66 @@ def get_model_status():
     """Get the status of all required models."""
     status = {}
     
-    for model_name, config in MODELS_CONFIG.items():
-        model_dir = os.path.join(MODELS_DIR, model_name)
-        exists = check_model_exists(model_name)
-        
-        status[model_name] = {
-            "exists": exists,
-            "path": model_dir,
-            "description": config.get("description", ""),
-            "type": config.get("type", "unknown")
+    for entry in _MODEL_PLAN.values():
+        status[entry.name] = {
+            "exists": check_model_exists(entry.name),
+            "path": entry.model_dir,
+            "description": entry.description,
+            "type": entry.type or "unknown"
         }
     
     return status
 
 
+# Only download llama and piper
+LLAMA_REQUIRED_MODELS = ("llama-3.2-3b-instruct", "piper")
+
+
+def _model_files(model_name: str) -> tuple:
+    """List the files a model is made of (its directory if none are listed)."""
+    entry = _MODEL_PLAN.get(model_name) or _plan_entry(model_name, {})
+    return entry.required_paths or (entry.model_dir,)
+
+
+def _ready_sentinel_is_fresh(model_names) -> bool:
+    """Check that the ready sentinel is newer than every model file."""
+    try:
+        ready_mtime = os.stat(READY_SENTINEL).st_mtime
+        return all(
+            os.stat(path).st_mtime <= ready_mtime
+            for model_name in model_names
+            for path in _model_files(model_name)
+        )
+    except OSError:
+        return False
+
+
+def _write_ready_sentinel():
+    """Touch the ready sentinel; failing to write it only costs a slow check."""
+    try:
+        with open(READY_SENTINEL, "w"):
+            pass
+    except OSError:
+        pass
+
+
 def ensure_llama_models_exist() -> bool:
     """
     Ensure only the Llama-3.2-3B and Piper models are downloaded.
     This is for the new lightweight assistant (run_assistant.py).
     Returns True if ready, False otherwise.
     """
+    global _MODELS_READY
+    if _MODELS_READY or _ready_sentinel_is_fresh(LLAMA_REQUIRED_MODELS):
+        _MODELS_READY = True
+        return True
+    
     print_status("Checking models for Llama-3.2 assistant...", "info")
     
     os.makedirs(MODELS_DIR, exist_ok=True)
     all_success = True
     
-    # Only download llama and piper
-    required_models = ["llama-3.2-3b-instruct", "piper"]
-    
-    for model_name in required_models:
+    for model_name in LLAMA_REQUIRED_MODELS:
         config = MODELS_CONFIG.get(model_name)
         if not config:
             print_status(f"Model config not found: {model_name}", "error")
@@ -323,10 +607,10 @@ def ensure_llama_models_exist() -> bool:
         model_dir = os.path.join(MODELS_DIR, model_name)
         
         if check_model_exists(model_name):
-            print_status(f"✓ {model_name}: Ready", "success")
+            print_status(f"{_MARK_OK} {model_name}: Ready", "success")
             continue
         
-        print_status(f"✗ {model_name}: Downloading...", "warning")
+        print_status(f"{_MARK_MISSING} {model_name}: Downloading...", "warning")
         
         if config["type"] == "gguf":
             success = download_gguf_model(
@@ -349,6 +633,8 @@ def ensure_llama_models_exist() -> bool:
     
     if all_success:
         print_status("Llama-3.2 assistant models ready!", "success")
+        _write_ready_sentinel()
+        _MODELS_READY = True
     
     return all_success
 
@@ -10,48 +10,183 @@ import json
 import time
 import re
 import datetime
+import queue
+import threading
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 import concurrent.futures
 
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
+# Kokoro allocates differently sized tensors for every sentence; growable
+# segments keep the torch allocator from fragmenting. Must be set before
+# torch is first imported.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 from cli_animations import (
-    listening, thinking, speaking, loading,
+    listening, thinking, loading,
     print_banner, print_status, print_response_header, print_separator,
     print_instructions, WaitingForInput, Colors
 )
 from tools import get_all_tools, execute_tool
 from model_downloader import ensure_llama_models_exist, get_llama_model_path
 
+# Set ASSISTANT_DEBUG=1 to print raw LLM output and tool-call parsing
+DEBUG = os.environ.get("ASSISTANT_DEBUG") == "1"
+
 # Audio settings
 SAMPLE_RATE = 16000
-RECORD_DURATION = 5
+RECORD_DURATION = 10  # Max seconds; recording stops early once the speaker pauses
+
+# End-of-speech detection
+VAD_FRAME_MS = 20  # webrtcvad accepts 10, 20 or 30 ms frames
+VAD_AGGRESSIVENESS = 2  # 0 (least) to 3 (most) aggressive at filtering non-speech
+VAD_SILENCE_MS = 500  # Trailing silence that ends the recording
+VAD_MIN_SPEECH_FRAMES = 10  # Voiced frames required before silence can end it
+VAD_PREROLL_MS = 300  # Audio kept from before the first voiced frame
+ENERGY_THRESHOLD = 500  # int16 RMS treated as speech when webrtcvad is missing
+
+# Llama settings
+LLAMA_N_CTX = 4096
+LLAMA_N_BATCH = 512  # Prompt tokens evaluated per batch during prefill
+# Nothing after </speak> is used, so stop decoding as soon as it appears
+LLAMA_STOP = ["<|eot_id|>", "<|end_of_text|>", "</speak>"]
+
+# Whisper settings
+WHISPER_MODEL = "base.en"  # English-only; transcribe() always forces language="en"
+WHISPER_CPU_COMPUTE = "int8"  # CTranslate2 int8 kernels on CPU
+WHISPER_GPU_COMPUTE = "int8_float16"  # int8 weights, float16 activations
+WHISPER_CPU_BEAM = 1  # Greedy; each extra beam costs a full decoder pass on CPU
+WHISPER_GPU_BEAM = 5  # Beams batch on the GPU at about the same latency
 
 # Kokoro TTS settings
 KOKORO_VOICE = "af_heart"  # American female voice
 KOKORO_LANG = "a"  # American English
+KOKORO_SAMPLE_RATE = 24000  # Kokoro outputs at 24kHz
+PLAYBACK_SLICE = KOKORO_SAMPLE_RATE // 10  # Frames written per call, so a reply can be cut off within 0.1 s
+PLAYBACK_QUEUE_CHUNKS = 4  # Synthesized chunks allowed to wait for the speaker
 
 # Get tools dynamically from registry
 TOOLS = get_all_tools()
 
+# Static start of the system prompt; the tool list and current time follow it.
+# Everything before the time is identical between turns, so llama.cpp can
+# reuse its evaluated KV cache for that prefix instead of re-reading it.
+SYSTEM_PROMPT_RULES = (
+    "You are a precise, function-calling AI assistant. You exist to execute commands for the user.\n"
+    "YOUR GLOBAL MANDATE: ACCURACY OVER CONVERSATION.\n\n"
+    "CRITICAL RULES:\n"
+    "1. IF A TOOL FITS THE REQUEST, YOU MUST USE IT. Do not explain, just output the JSON.\n"
+    "2. NEVER guess system stats, file contents, or network info. If you don't have the data, call a tool.\n"
+    "3. OUTPUT FORMAT: For tools, output ONLY valid JSON. No Markdown, no backticks, no text.\n"
+    "   Format: {\"tool\": \"tool_name\", \"args\": {...}}\n\n"
+    "EXAMPLES (Follow these patterns exactly):\n"
+    "User: 'Open Firefox'\n"
+    "Assistant: {\"tool\": \"open_application\", \"args\": {\"app_name\": \"firefox\"}}\n\n"
+    "User: 'How is my system?'\n"
+    "Assistant: {\"tool\": \"get_system_stats\", \"args\": {}}\n\n"
+    "User: 'Do I have any PDF files?'\n"
+    "Assistant: {\"tool\": \"find_files\", \"args\": {\"pattern\": \"*.pdf\"}}\n\n"
+    "User: 'Open the first one'\n"
+    "Assistant: {\"tool\": \"find_and_open_file\", \"args\": {\"pattern\": \"*.pdf\", \"which\": 1}}\n\n"
+)
+SYSTEM_PROMPT_END = "\n\nNow answer the user's request."
+
+# Sentence end followed by whitespace; finished sentences go to TTS early
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _speech_detector(sample_rate):
+    """Return a function that tells whether one int16 frame contains speech."""
+    if webrtcvad is not None:
+        vad = webrtcvad.Vad(VAD_AGGRESSIVENESS)
+        return lambda frame: vad.is_speech(frame, sample_rate)
+    
+    threshold = float(ENERGY_THRESHOLD) ** 2
+    
+    def is_loud(frame):
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        return float(np.dot(samples, samples)) / len(samples) > threshold
+    
+    return is_loud
+
 
-def record_audio(duration, sample_rate):
-    """Record audio for a fixed duration."""
-    with listening(duration):
-        recording = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='float32')
-        sd.wait()
+def record_audio(max_duration, sample_rate):
+    """Record until the speaker pauses, or for at most max_duration seconds.
+
+    Returns float32 samples in [-1, 1], or an empty array if no speech was heard.
+    """
+    frame_len = sample_rate * VAD_FRAME_MS // 1000
+    max_frames = int(max_duration * 1000) // VAD_FRAME_MS
+    silence_limit = VAD_SILENCE_MS // VAD_FRAME_MS
+    preroll = VAD_PREROLL_MS // VAD_FRAME_MS
+    is_speech = _speech_detector(sample_rate)
+    
+    # Frames are copied into one buffer sized for the longest recording
+    frame_bytes = frame_len * 2  # int16 mono
+    pcm = bytearray(max_frames * frame_bytes)
+    n_frames = 0
+    first_voiced = None
+    voiced = 0
+    silent_run = 0
+    with listening(max_duration):
+        with sd.RawInputStream(samplerate=sample_rate, blocksize=frame_len,
+                               channels=1, dtype='int16') as stream:
+            while n_frames < max_frames:
+                data, _ = stream.read(frame_len)
+                frame = bytes(data)
+                pcm[n_frames * frame_bytes:(n_frames + 1) * frame_bytes] = frame
+                n_frames += 1
+                if is_speech(frame):
+                    if first_voiced is None:
+                        first_voiced = n_frames - 1
+                    voiced += 1
+                    silent_run = 0
+                else:
+                    silent_run += 1
+                    if voiced >= VAD_MIN_SPEECH_FRAMES and silent_run >= silence_limit:
+                        break
+    
+    if voiced < VAD_MIN_SPEECH_FRAMES:
+        return np.empty(0, dtype=np.float32)
+    
     print_status("Recording captured!", "success")
-    return recording.flatten()
+    # Whisper's cost grows with input length; skip the wait before speaking
+    start = max(0, first_voiced - preroll) * frame_bytes
+    samples = np.frombuffer(pcm, dtype=np.int16, count=(n_frames * frame_bytes - start) // 2, offset=start)
+    # Convert and scale in one pass straight into the float32 result
+    return np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+
+def physical_core_count() -> int:
+    """Count physical CPU cores; SMT siblings slow llama.cpp's matmul threads down."""
+    cores = psutil.cpu_count(logical=False) if psutil else None
+    return max(1, cores or (os.cpu_count() or 2) // 2)
 
 
-def play_audio(audio_data, sample_rate=24000):
-    with speaking():
-        sd.play(audio_data, sample_rate)
-        sd.wait()
-    print_status("Playback complete!", "audio")
+def prefetch_file(path: str):
+    """Ask the kernel to read a model file into the page cache ahead of use."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Not downloaded yet, the loader will fetch it
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except (AttributeError, OSError):
+        pass  # Not available on this platform
+    finally:
+        os.close(fd)
 
 
 def format_tools_for_prompt(tools: list) -> str:
@@ -72,6 +207,215 @@ def format_tools_for_prompt(tools: list) -> str:
     return "\n".join(tool_strs)
 
 
+class ToolCallScanner:
+    """Find the first complete {"tool": ..., "args": {...}} object in streamed text.
+
+    Braces are counted as text arrives (ignoring those inside JSON strings),
+    so a tool call is recognised the moment its closing brace is generated.
+    """
+    
+    def __init__(self):
+        self._text = ""
+        self._pos = 0  # Next character to scan
+        self._depth = 0
+        self._start = 0  # Index of the outermost open brace
+        self._in_string = False
+        self._escape = False
+        self.json_str = None
+    
+    def feed(self, delta: str):
+        """Scan new text. Returns the parsed tool call once one is complete, else None."""
+        self._text += delta
+        text = self._text
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = self._depth > 0
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = text[self._start:i + 1]
+                    call = self._parse(candidate)
+                    if call is not None:
+                        self._pos = i + 1
+                        self.json_str = candidate
+                        return call
+        self._pos = len(text)
+        return None
+    
+    def finish(self):
+        """Retry from every open brace once the stream has ended.
+
+        Catches a tool call that follows an unbalanced brace in prose, which
+        the incremental count cannot recover from.
+        """
+        if self.json_str is not None:
+            return None
+        decoder = json.JSONDecoder()
+        text = self._text
+        start = text.find("{")
+        while start != -1:
+            try:
+                _, end = decoder.raw_decode(text, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                call = self._parse(text[start:end])
+                if call is not None:
+                    self.json_str = text[start:end]
+                    return call
+            start = text.find("{", start + 1)
+        return None
+    
+    @staticmethod
+    def _parse(candidate: str):
+        try:
+            call = json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+            return None
+        if not isinstance(call.setdefault("args", {}), dict):
+            return None
+        return call
+
+
+class SentenceSpeaker:
+    """Speak streamed LLM text sentence by sentence on background threads.
+
+    One thread synthesizes sentences and another plays the audio, so the next
+    sentence is synthesized while the current one is still playing. Once a
+    <speak> tag arrives only the text between it and </speak> is spoken;
+    anything before the tag is dropped. A reply that never has the tag is
+    spoken whole by finish(), as finished responses were before. Playback
+    keeps going after finish() returns until the reply ends or cancel() is
+    called, so the user can start the next question over it; cancel() returns
+    once the speaker is silent, so recording doesn't pick up the reply.
+    """
+    
+    def __init__(self, assistant, stream):
+        self._assistant = assistant
+        self._stream = stream
+        self._pending = ""
+        self._opened = False  # Set once <speak> has been seen
+        self._closed = False  # Set once </speak> has been seen
+        self._cancelled = threading.Event()
+        self._queue = queue.Queue()
+        self._audio = queue.Queue(maxsize=PLAYBACK_QUEUE_CHUNKS)
+        threading.Thread(target=self._synthesize, daemon=True).start()
+        self._player = threading.Thread(target=self._playback, daemon=True)
+        self._player.start()
+    
+    def _synthesize(self):
+        while True:
+            sentence = self._queue.get()
+            if sentence is None:
+                self._audio.put(None)
+                return
+            if self._cancelled.is_set():
+                continue  # Drain what was queued before the cancel
+            for chunk in self._assistant.speak_stream(sentence):
+                if self._cancelled.is_set():
+                    break
+                self._audio.put(np.asarray(chunk, dtype=np.float32))
+    
+    def _playback(self):
+        while not self._cancelled.is_set():
+            audio = self._audio.get()
+            if audio is None:
+                return
+            self._play(audio)
+    
+    def _play(self, audio):
+        """Write audio in short slices, stopping early if cancelled."""
+        for start in range(0, len(audio), PLAYBACK_SLICE):
+            if self._cancelled.is_set():
+                return
+            self._stream.write(audio[start:start + PLAYBACK_SLICE])
+    
+    def _say(self, text: str):
+        text = text.strip()
+        if text:
+            self._queue.put(text)
+    
+    def feed(self, delta: str):
+        """Add generated text; each completed sentence inside <speak> is queued for speech."""
+        if self._closed:
+            return
+        pending = self._pending + delta
+        if not self._opened:
+            start = pending.find("<speak>")
+            if start == -1:
+                self._pending = pending  # Held until the tag shows up or finish()
+                return
+            pending = pending[start + len("<speak>"):]
+            self._opened = True
+        end = pending.find("</speak>")
+        if end != -1:
+            for sentence in SENTENCE_END_RE.split(pending[:end]):
+                self._say(sentence)
+            self._pending = ""
+            self._closed = True
+            return
+        *sentences, self._pending = SENTENCE_END_RE.split(pending)
+        for sentence in sentences:
+            self._say(sentence)
+    
+    def discard_pending(self):
+        """Drop text not yet queued and accept new text, e.g. for a follow-up reply."""
+        self._pending = ""
+        self._opened = False
+        self._closed = False
+    
+    def finish(self):
+        """Queue whatever text is left; playback continues in the background.
+
+        Without a <speak> tag the whole reply is spoken, one sentence at a time.
+        """
+        if not self._closed:
+            pending = self._pending
+            if not self._opened:
+                pending = pending.replace("</speak>", "")
+            for sentence in SENTENCE_END_RE.split(pending):
+                self._say(sentence)
+        self._pending = ""
+        self._closed = True
+        self._queue.put(None)
+    
+    def cancel(self):
+        """Stop speaking, drop anything still queued and wait until playback is silent."""
+        self._cancelled.set()
+        try:
+            self._audio.put_nowait(None)  # Wake the player if it is waiting for audio
+        except queue.Full:
+            pass
+        self._player.join()  # At most one PLAYBACK_SLICE write left
+        
+        # Free room for a chunk synthesis may be blocked on; it queues nothing
+        # after seeing the cancel, and exits even if finish() was never called
+        while True:
+            try:
+                self._audio.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(None)
+        
+        # Drop the audio PortAudio has buffered but not yet played
+        self._stream.abort()
+        self._stream.start()
+
+
 class SpeechAssistant:
     def __init__(self):
         self.whisper_model = None
@@ -80,17 +424,38 @@ class SpeechAssistant:
         self.conversation_history = []
         self.max_history = 2  # Only keep 1 previous turn to minimize hallucination
         self._last_tool_result = None
+        self._whisper_beam = WHISPER_CPU_BEAM
+        self._warmup_thread = None
+        
+        # TOOLS is fixed at import, so render the tool list once
+        self._system_prompt_head = (
+            SYSTEM_PROMPT_RULES
+            + f"AVAILABLE TOOLS:\n{format_tools_for_prompt(TOOLS)}\n\n"
+            + "CONTEXT:\nOS: Linux (CachyOS)\nTime: "
+        )
+    
+    def _system_prompt(self) -> str:
+        """Build the system prompt; only the trailing time changes between turns."""
+        current_time = datetime.datetime.now().strftime("%A, %B %d, %Y %I:%M %p")
+        return self._system_prompt_head + current_time + SYSTEM_PROMPT_END
     
     def load_models(self):
-        """Load all models in parallel for faster startup."""
-        import whisper
+        """Load all models, warming the page cache for the Llama weights first."""
+        import ctranslate2
+        from faster_whisper import WhisperModel
         from llama_cpp import Llama
         
+        llama_path = get_llama_model_path()
+        
         def load_whisper():
-            return whisper.load_model("base")
+            # Ask CTranslate2 itself, since torch seeing a GPU doesn't mean
+            # CTranslate2 was built with CUDA
+            if ctranslate2.get_cuda_device_count() > 0:
+                self._whisper_beam = WHISPER_GPU_BEAM
+                return WhisperModel(WHISPER_MODEL, device="cuda", compute_type=WHISPER_GPU_COMPUTE)
+            return WhisperModel(WHISPER_MODEL, device="cpu", compute_type=WHISPER_CPU_COMPUTE)
         
         def load_llama():
-            model_path = get_llama_model_path()
             n_gpu_layers = 0
             try:
                 import torch
@@ -101,9 +466,13 @@ class SpeechAssistant:
                 print_status("Running on CPU (install torch for GPU)", "info")
             
             return Llama(
-                model_path=model_path,
-                n_ctx=4096,
+                model_path=llama_path,
+                n_ctx=LLAMA_N_CTX,
                 n_gpu_layers=n_gpu_layers,
+                n_threads=physical_core_count(),
+                n_batch=LLAMA_N_BATCH,
+                use_mmap=True,
+                use_mlock=False,
                 verbose=False
             )
         
@@ -115,117 +484,186 @@ class SpeechAssistant:
                 print_status(f"Kokoro error: {e}", "warning")
                 return None
         
-        with loading("Loading models in parallel (Whisper + Llama + Kokoro)") as loader:
-            loader.set_progress(10, "Starting parallel load...")
+        with loading("Loading models (Whisper + Llama + Kokoro)") as loader:
+            loader.set_progress(10, "Prefetching model files...")
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                whisper_future = executor.submit(load_whisper)
-                llama_future = executor.submit(load_llama)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(prefetch_file, llama_path)
                 kokoro_future = executor.submit(load_kokoro)
                 
+                # Whisper and Llama contend for CPU when built on threads, so
+                # build them in turn while the workers keep the disk busy
                 loader.set_progress(30, "Loading Whisper...")
-                self.whisper_model = whisper_future.result()
+                self.whisper_model = load_whisper()
                 
                 loader.set_progress(60, "Loading Llama-3.2-3B...")
-                self.llm = llama_future.result()
+                self.llm = load_llama()
                 
-                loader.set_progress(90, "Loading Kokoro TTS...")
+                loader.set_progress(85, "Loading Kokoro TTS...")
                 self.kokoro_pipeline = kokoro_future.result()
             
+            loader.set_progress(95, "Warming up prompt cache...")
+            self.warm_prompt_cache()
+            
+            # Hand scratch memory left over from loading back to the driver
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except ImportError:
+                pass
+            
             loader.set_progress(100, "All models loaded!")
     
+    def warm_prompt_cache(self):
+        """Evaluate the system prompt and history so the next question only pays for its own tokens."""
+        self.llm.create_chat_completion(
+            messages=[
+                {"role": "system", "content": self._system_prompt()},
+                *self.conversation_history[-2:],
+            ],
+            max_tokens=1,
+        )
+    
+    def start_prompt_warmup(self):
+        """Warm the prompt cache in the background, e.g. while the user is speaking.
+
+        Trimming history to one turn means the next prompt diverges from the
+        cached tokens right after the system prompt, so without this the
+        previous turn would be prefilled again once the question is known.
+        """
+        self._join_warmup()
+        self._warmup_thread = threading.Thread(target=self.warm_prompt_cache, daemon=True)
+        self._warmup_thread.start()
+    
+    def _join_warmup(self):
+        # The Llama context is not thread-safe; wait before touching it again
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+            self._warmup_thread = None
+    
     def transcribe(self, audio_data):
         """Transcribe audio using Whisper."""
-        audio_fp32 = audio_data.astype(np.float32)
-        result = self.whisper_model.transcribe(audio_fp32, language="en")
-        return result["text"].strip()
-    
-    def generate_response(self, user_text: str) -> str:
-        """Generate a response using Llama-3.2-3B with tool calling."""
-        current_time = datetime.datetime.now().strftime("%A, %B %d, %Y %I:%M %p")
-        
-        # Build system prompt with tools
-        tools_text = format_tools_for_prompt(TOOLS)
-        
-        system_prompt = (
-            "You are a precise, function-calling AI assistant. You exist to execute commands for the user.\n"
-            "YOUR GLOBAL MANDATE: ACCURACY OVER CONVERSATION.\n\n"
-            "CRITICAL RULES:\n"
-            "1. IF A TOOL FITS THE REQUEST, YOU MUST USE IT. Do not explain, just output the JSON.\n"
-            "2. NEVER guess system stats, file contents, or network info. If you don't have the data, call a tool.\n"
-            "3. OUTPUT FORMAT: For tools, output ONLY valid JSON. No Markdown, no backticks, no text.\n"
-            f"   Format: {{\"tool\": \"tool_name\", \"args\": {{...}}}}\n\n"
-            "EXAMPLES (Follow these patterns exactly):\n"
-            "User: 'Open Firefox'\n"
-            "Assistant: {\"tool\": \"open_application\", \"args\": {\"app_name\": \"firefox\"}}\n\n"
-            "User: 'How is my system?'\n"
-            "Assistant: {\"tool\": \"get_system_stats\", \"args\": {}}\n\n"
-            "User: 'Do I have any PDF files?'\n"
-            "Assistant: {\"tool\": \"find_files\", \"args\": {\"pattern\": \"*.pdf\"}}\n\n"
-            "User: 'Open the first one'\n"
-            "Assistant: {\"tool\": \"find_and_open_file\", \"args\": {\"pattern\": \"*.pdf\", \"which\": 1}}\n\n"
-            f"CONTEXT:\nTime: {current_time}\nOS: Linux (CachyOS)\n\n"
-            f"AVAILABLE TOOLS:\n{tools_text}\n\n"
-            "Now answer the user's request."
+        audio_fp32 = np.ascontiguousarray(audio_data, dtype=np.float32)  # No-op for record_audio output
+        # A single short utterance: no earlier window to condition on, and a
+        # fixed temperature avoids re-decoding with the fallback schedule
+        segments, _ = self.whisper_model.transcribe(
+            audio_fp32,
+            language="en",
+            vad_filter=True,
+            beam_size=self._whisper_beam,
+            temperature=0.0,
+            condition_on_previous_text=False,
         )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+    
+    def _stream_chat(self, messages, max_tokens, on_text=None, temperature=0.3) -> str:
+        """Run a streamed chat completion, passing each text delta to on_text.
 
-        # Build messages - only keep last turn to minimize hallucination
-        messages = [{"role": "system", "content": system_prompt}]
+        Generation stops early if on_text returns True.
+        """
+        parts = []
+        for chunk in self.llm.create_chat_completion(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop=LLAMA_STOP,
+            stream=True
+        ):
+            delta = chunk["choices"][0]["delta"].get("content")
+            if delta:
+                parts.append(delta)
+                if on_text is not None and on_text(delta):
+                    break  # Closing the stream stops llama.cpp decoding
         
-        # Add only the previous turn (if any)
-        for msg in self.conversation_history[-2:]:
-            messages.append(msg)
+        text = "".join(parts).strip()
+        # llama.cpp drops the matched stop string; restore the closing tag
+        if "<speak>" in text and "</speak>" not in text:
+            text += "</speak>"
+        return text
+    
+    def generate_response(self, user_text: str, speaker=None) -> str:
+        """Generate a response using Llama-3.2-3B with tool calling.
+
+        If a SentenceSpeaker is given, spoken text is fed to it while tokens
+        are still being generated.
+        """
+        self._join_warmup()
+        system_prompt = self._system_prompt()
+
+        # Build messages - only keep last turn to minimize hallucination.
+        # History stays as text: llama.cpp skips re-evaluating the token
+        # prefix shared with its previous call, so earlier turns only cost a
+        # re-tokenize, which is negligible next to decoding.
+        messages = [
+            {"role": "system", "content": system_prompt},
+            *self.conversation_history[-2:],  # Previous turn (if any)
+            {"role": "user", "content": user_text},
+        ]
         
-        messages.append({"role": "user", "content": user_text})
+        # Generate response, stopping as soon as a complete tool call has
+        # been produced. Text is spoken as it streams until the first '{',
+        # which may start tool-call JSON; everything from there is held back
+        # and only spoken if the reply ends without a tool call. Decoding is
+        # greedy so tool names and arguments come out as the model's best
+        # guess instead of occasionally sampled into malformed JSON.
+        scanner = ToolCallScanner()
+        tool_call = None
+        held = []
         
-        # Generate response
-        response = self.llm.create_chat_completion(
-            messages=messages,
-            max_tokens=256,
-            temperature=0.3,
-            stop=["<|eot_id|>", "<|end_of_text|>"]
-        )
+        def on_text(delta):
+            nonlocal tool_call
+            if speaker is not None:
+                if held:
+                    held.append(delta)
+                else:
+                    brace = delta.find("{")
+                    if brace == -1:
+                        speaker.feed(delta)
+                    else:
+                        speaker.feed(delta[:brace])
+                        held.append(delta[brace:])
+            tool_call = scanner.feed(delta)
+            return tool_call is not None
         
-        response_text = response["choices"][0]["message"]["content"].strip()
+        response_text = self._stream_chat(messages, 256, on_text, temperature=0.0)
+        if tool_call is None:
+            tool_call = scanner.finish()
+        if tool_call is None and held:
+            speaker.feed("".join(held))
         
         # DEBUG: Show raw LLM output to diagnose tool calling
-        print(f"\n{Colors.YELLOW}[DEBUG] Raw LLM output: {response_text[:200]}...{Colors.RESET}")
-        
-        # Check if there's a tool call JSON anywhere in the response
-        # This regex handles nested braces in the args object
-        json_match = re.search(r'\{\s*"tool"\s*:\s*"[^"]+"\s*,\s*"args"\s*:\s*\{[^}]*\}\s*\}', response_text)
+        if DEBUG:
+            print(f"\n{Colors.YELLOW}[DEBUG] Raw LLM output: {response_text[:200]}...{Colors.RESET}")
         
-        if json_match:
-            json_str = json_match.group(0)
-            print(f"{Colors.GREEN}[DEBUG] Found tool JSON: {json_str}{Colors.RESET}")
+        if tool_call is not None:
+            json_str = scanner.json_str
+            if DEBUG:
+                print(f"{Colors.GREEN}[DEBUG] Found tool JSON: {json_str}{Colors.RESET}")
             
-            try:
-                # Parse tool call
-                tool_call = json.loads(json_str)
-                tool_name = tool_call.get("tool", "")
-                tool_args = tool_call.get("args", {})
-                
-                print_status(f"Calling tool: {tool_name}", "info")
-                tool_result = execute_tool(tool_name, tool_args)
-                self._last_tool_result = tool_result
-                
-                # Generate follow-up response with tool result
-                messages.append({"role": "assistant", "content": json_str})
-                messages.append({"role": "user", "content": f"Tool result: {tool_result}\n\nSummarize this briefly for voice output (1-2 sentences, no technical details). Wrap your spoken response in <speak>...</speak> tags."})
-                
-                follow_up = self.llm.create_chat_completion(
-                    messages=messages,
-                    max_tokens=128,
-                    temperature=0.3,
-                    stop=["<|eot_id|>", "<|end_of_text|>"]
-                )
-                response_text = follow_up["choices"][0]["message"]["content"].strip()
-                
-            except json.JSONDecodeError as e:
-                print_status(f"JSON parse error: {e}", "warning")
-                self._last_tool_result = None
+            tool_name = tool_call["tool"]
+            tool_args = tool_call["args"]
+            
+            print_status(f"Calling tool: {tool_name}", "info")
+            tool_result = execute_tool(tool_name, tool_args)
+            self._last_tool_result = tool_result
+            
+            # Generate follow-up response with tool result. Echo the first
+            # pass verbatim so the follow-up prompt matches the tokens
+            # llama.cpp just evaluated and only the tool turn is prefilled.
+            messages.append({"role": "assistant", "content": response_text})
+            messages.append({"role": "user", "content": f"Tool result: {tool_result}\n\nSummarize this briefly for voice output (1-2 sentences, no technical details). Wrap your spoken response in <speak>...</speak> tags."})
+            
+            # Drop any unfinished first-pass sentence so it isn't glued onto
+            # the summary
+            if speaker is not None:
+                speaker.discard_pending()
+            response_text = self._stream_chat(
+                messages, 128, speaker.feed if speaker is not None else None
+            )
         else:
-            print(f"{Colors.YELLOW}[DEBUG] No tool call found in response{Colors.RESET}")
+            if DEBUG:
+                print(f"{Colors.YELLOW}[DEBUG] No tool call found in response{Colors.RESET}")
             self._last_tool_result = None
         
         # Update history
@@ -239,25 +677,18 @@ class SpeechAssistant:
         return response_text
     
     
-    def speak(self, text: str, output_path: str) -> bool:
-        """Synthesize speech using Kokoro TTS."""
+    def speak_stream(self, text: str):
+        """Synthesize speech using Kokoro TTS, yielding audio chunks as they are produced."""
         if not self.kokoro_pipeline:
             print_status("TTS not available", "warning")
-            return False
+            return
         
         try:
-            # Generate audio using Kokoro
-            audio_chunks = []
             for _, _, audio in self.kokoro_pipeline(text, voice=KOKORO_VOICE, speed=1.0):
-                audio_chunks.append(audio)
-            
-            # Combine chunks and save
-            full_audio = np.concatenate(audio_chunks) if len(audio_chunks) > 1 else audio_chunks[0]
-            sf.write(output_path, full_audio, 24000)  # Kokoro outputs at 24kHz
-            return True
+                if audio is not None:
+                    yield audio
         except Exception as e:
             print_status(f"TTS error: {e}", "warning")
-            return False
 
 
 def main():
@@ -275,6 +706,12 @@ def main():
     print_status("Lightweight Llama-3.2-3B assistant ready.", "info")
     print_instructions(RECORD_DURATION)
     
+    # One output stream for the whole session; each reply is written into it
+    # chunk by chunk instead of going through a WAV file
+    out_stream = sd.OutputStream(samplerate=KOKORO_SAMPLE_RATE, channels=1, dtype='float32')
+    out_stream.start()
+    
+    speaker = None
     try:
         while True:
             wait_anim = WaitingForInput()
@@ -284,9 +721,16 @@ def main():
             finally:
                 wait_anim.stop()
             
+            # The previous reply plays while waiting; a new question cuts it off
+            if speaker is not None:
+                speaker.cancel()
+            
+            # Re-evaluate the kept history while the user is still talking
+            assistant.start_prompt_warmup()
             audio = record_audio(RECORD_DURATION, SAMPLE_RATE)
             
             if len(audio) == 0:
+                print_status("No speech detected, try again.", "warning")
                 continue
             
             print_status("Transcribing...", "info")
@@ -297,9 +741,13 @@ def main():
                 print_status("No speech detected, try again.", "warning")
                 continue
             
+            # Speech starts on the first finished sentence, while the rest
+            # of the reply is still generating
+            speaker = SentenceSpeaker(assistant, out_stream) if assistant.kokoro_pipeline else None
+            
             print_response_header()
             with thinking():
-                response = assistant.generate_response(user_text)
+                response = assistant.generate_response(user_text, speaker)
             
             # Display tool result if any
             if assistant._last_tool_result:
@@ -310,22 +758,21 @@ def main():
             display_response = response.replace('<speak>', '').replace('</speak>', '')
             print(f"{Colors.BOLD}Assistant:{Colors.RESET} {display_response}")
             
-            # Extract speech content from <speak> tags, or use full response
-            speak_match = re.search(r'<speak>(.*?)</speak>', response, re.DOTALL)
-            speech_text = speak_match.group(1).strip() if speak_match else response
-            
-            # Speak
-            output_path = os.path.join(SCRIPT_DIR, "response.wav")
-            if assistant.speak(speech_text, output_path):
-                audio_data, sr = sf.read(output_path)
-                play_audio(audio_data.astype(np.float32), sr)
-                os.remove(output_path)
+            # The rest of the reply plays in the background
+            if speaker is not None:
+                speaker.finish()
+            else:
+                print_status("TTS not available", "warning")
             
             print_separator()
     
     except KeyboardInterrupt:
         print()
         print_status("Goodbye!", "info")
+    finally:
+        if speaker is not None:
+            speaker.cancel()
+        out_stream.close()
 
 
 if __name__ == "__main__":
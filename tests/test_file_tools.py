@@ -0,0 +1,39 @@
+"""Tests for the cached file search in tools.file_tools."""
+
+import os
+import tempfile
+import unittest
+
+from tools import file_tools
+
+
+class FindFilesCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        file_tools._SEARCH_CACHE.clear()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.makedirs(os.path.join(self.root, "sub"))
+        open(os.path.join(self.root, "sub", "report.txt"), "w").close()
+    
+    def tearDown(self):
+        file_tools._SEARCH_CACHE.clear()
+        self._tmp.cleanup()
+    
+    def test_failing_search_fails_again_on_repeat(self):
+        for _ in range(2):
+            result = file_tools.find_files("sub/**report", self.root)
+            self.assertTrue(result.startswith("Search error"), result)
+    
+    def test_file_filter_shares_the_cached_walk(self):
+        self.assertIn("report.txt", file_tools.find_files("report", self.root))
+        self.assertEqual(list(file_tools._SEARCH_CACHE), [(self.root, "report")])
+        self.assertEqual(
+            file_tools._find_matches(self.root, "report", "file"),
+            [os.path.join(self.root, "sub", "report.txt")]
+        )
+        self.assertEqual(len(file_tools._SEARCH_CACHE), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for what SentenceSpeaker passes on to speech synthesis."""
+
+import unittest
+
+try:
+    from run_assistant import SentenceSpeaker
+except ImportError as e:  # Audio dependencies not installed
+    SentenceSpeaker = None
+    _IMPORT_ERROR = str(e)
+else:
+    _IMPORT_ERROR = ""
+
+
+class _RecordingAssistant:
+    """Stands in for SpeechAssistant; remembers each sentence instead of synthesizing it."""
+    
+    def __init__(self):
+        self.spoken = []
+    
+    def speak_stream(self, text):
+        self.spoken.append(text)
+        return iter(())
+
+
+@unittest.skipIf(SentenceSpeaker is None, _IMPORT_ERROR)
+class SentenceSpeakerTest(unittest.TestCase):
+    
+    def _speak(self, deltas):
+        assistant = _RecordingAssistant()
+        speaker = SentenceSpeaker(assistant, None)
+        for delta in deltas:
+            speaker.feed(delta)
+        speaker.finish()
+        speaker._player.join(timeout=5)
+        return assistant.spoken
+    
+    def test_text_before_speak_tag_is_not_spoken(self):
+        spoken = self._speak(["Sure. <spe", "ak>Hello there. How", " are you?"])
+        self.assertEqual(spoken, ["Hello there.", "How are you?"])
+    
+    def test_text_after_closing_tag_is_not_spoken(self):
+        spoken = self._speak(["<speak>Hi. </speak> Extra words."])
+        self.assertEqual(spoken, ["Hi."])
+    
+    def test_untagged_reply_is_spoken_whole(self):
+        spoken = self._speak(["It is sunny. ", "Enjoy it!"])
+        self.assertEqual(spoken, ["It is sunny.", "Enjoy it!"])
+    
+    def test_discarded_preamble_is_not_spoken(self):
+        assistant = _RecordingAssistant()
+        speaker = SentenceSpeaker(assistant, None)
+        speaker.feed("Let me check. ")
+        speaker.discard_pending()
+        speaker.feed("<speak>All good.</speak>")
+        speaker.finish()
+        speaker._player.join(timeout=5)
+        self.assertEqual(assistant.spoken, ["All good."])
+
+
+if __name__ == "__main__":
+    unittest.main()
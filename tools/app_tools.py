@@ -8,6 +8,8 @@ import subprocess
 import shutil
 from typing import Optional
 from .tool_registry import register_tool
+from .process_utils import spawn_detached
+from .file_tools import _HALLUCINATED_HOME_RE
 
 logger = logging.getLogger("tools.app")
 
@@ -15,7 +17,7 @@ logger = logging.getLogger("tools.app")
 HOME_DIR = os.environ.get('HOME', os.path.expanduser("~"))
 
 # Whitelist of safe applications (can be expanded)
-ALLOWED_APPS = {
+ALLOWED_APPS = frozenset({
     # Browsers
     'firefox', 'chromium', 'brave', 'brave-browser', 'google-chrome', 
     'google-chrome-stable', 'chrome', 'vivaldi', 'opera', 'librewolf',
@@ -36,7 +38,7 @@ ALLOWED_APPS = {
     'discord', 'telegram-desktop', 'signal-desktop', 'slack', 'element-desktop',
     # Gaming
     'steam', 'lutris', 'heroic',
-}
+})
 
 # Common app name aliases for better matching
 APP_ALIASES = {
@@ -75,26 +77,39 @@ def _is_safe_app(name: str) -> bool:
     return name_lower not in DANGEROUS_COMMANDS
 
 
+# Resolved executables by (requested name, PATH). Only hits are kept, so an
+# app installed after a failed lookup is still found next time.
+_APP_PATH_CACHE = {}
+
+
 def _find_app_executable(app_name: str) -> Optional[str]:
     """Find the executable path for an app, trying various name variations."""
+    search_path = os.environ.get('PATH', os.defpath)
+    cache_key = (app_name, search_path)
+    app_path = _APP_PATH_CACHE.get(cache_key)
+    if app_path and os.access(app_path, os.X_OK):
+        return app_path
+    
     app_lower = app_name.lower().replace(' ', '-')
     
     # Apply alias if exists
     if app_lower in APP_ALIASES:
         app_lower = APP_ALIASES[app_lower]
     
-    # Check common app name variations
-    possible_names = [
+    # Check common app name variations. Most names have no '-' or '_', so
+    # drop repeats rather than walking PATH up to four times for one name.
+    possible_names = dict.fromkeys((
         app_lower,
         app_lower.replace('-', '_'),
         app_lower.replace('-', ''),
         app_lower.replace('_', '-'),
-    ]
+    ))
     
     for name in possible_names:
         if name in ALLOWED_APPS or _is_safe_app(name):
-            app_path = shutil.which(name)
+            app_path = shutil.which(name, path=search_path)
             if app_path:
+                _APP_PATH_CACHE[cache_key] = app_path
                 return app_path
     
     return None
@@ -112,12 +127,7 @@ def open_application(app_name: str) -> str:
     
     if app_path:
         try:
-            subprocess.Popen(
-                [app_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
+            spawn_detached([app_path])
             logger.info(f"Opened application: {app_name} ({app_path})")
             return f"Opened {app_name}."
         except Exception as e:
@@ -153,9 +163,7 @@ def open_file(path: str) -> str:
     target_path = path.strip()
     
     # Replace common LLM hallucinations
-    target_path = target_path.replace('/home/yourname/', '~/')
-    target_path = target_path.replace('/home/username/', '~/')
-    target_path = target_path.replace('/home/user/', '~/')
+    target_path = _HALLUCINATED_HOME_RE.sub('~/', target_path)
     
     # Expand ~ to actual home directory
     target_path = os.path.expanduser(target_path)
@@ -168,12 +176,7 @@ def open_file(path: str) -> str:
         return f"File not found: {path}. Hint: Use the exact path from find_files."
     
     try:
-        subprocess.Popen(
-            ['xdg-open', target_path],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
+        spawn_detached(['xdg-open', target_path])
         filename = os.path.basename(target_path)
         logger.info(f"Opened file: {target_path}")
         return f"Successfully opened {filename}."
@@ -206,12 +209,7 @@ def open_url(url: str) -> str:
         return f"Invalid URL: contains unsafe characters."
     
     try:
-        subprocess.Popen(
-            ['xdg-open', url],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
+        spawn_detached(['xdg-open', url])
         logger.info(f"Opened URL: {url}")
         return f"Opened {url} in browser."
         
@@ -3,47 +3,209 @@ File system tools - find, list, read files.
 """
 
 import os
+import re
 import glob
+import heapq
+import fnmatch
 import logging
 import stat
-import subprocess
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Iterator, Optional, List, Tuple
 from .tool_registry import register_tool
+from .process_utils import spawn_detached
 
 logger = logging.getLogger("tools.file")
 
 # Safety limits
 MAX_FILE_SIZE = 50 * 1024  # 50KB max for reading files
 MAX_RESULTS = 20  # Max search results
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'  # Dates shown by get_file_info
+
+# Recent searches, so "find X" followed by "open the second one" walks the
+# tree once. Entries hold the unfiltered walk, shared by every file_type,
+# and expire quickly to pick up new files.
+SEARCH_CACHE_TTL = 30.0  # Seconds
+SEARCH_CACHE_SIZE = 32
+_SEARCH_CACHE: "OrderedDict[tuple, list]" = OrderedDict()
+
+RECENT_WALK_WORKERS = 8  # Top-level subtrees walked in parallel by get_recent_files
 
 # Get home directory safely
 def _get_home_dir() -> str:
     return os.environ.get('HOME', os.path.expanduser("~"))
 
 HOME_DIR = _get_home_dir()
+_HOME_LEN = len(HOME_DIR)
+
+# Placeholder home directories LLMs tend to invent in paths
+_HALLUCINATED_HOME_RE = re.compile(r"^/home/(?:yourname|username|user)/")
 
 # Directories to exclude from searches
 EXCLUDED_DIRS = {'.git', '.venv', 'venv', 'node_modules', '__pycache__', 
                  '.cache', '.local/share/Trash', '.npm', '.cargo'}
 
 
+def _tildeify(path: str) -> str:
+    """Show a path under the home directory as ~/... (prefix only)."""
+    return "~" + path[_HOME_LEN:] if path.startswith(HOME_DIR) else path
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def _format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes < 0:
         return "0B"
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f}TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f}B"
+    # Each unit is 10 bits; pick it straight from the bit length
+    idx = min((int(size_bytes).bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (10 * idx)):.1f}{_SIZE_UNITS[idx]}"
+
+
+# Any excluded directory as whole path components; unlike splitting on
+# os.sep this also matches multi-component entries like '.local/share/Trash'
+_EXCL_RE = re.compile(
+    "(?:^|" + re.escape(os.sep) + ")(?:"
+    + "|".join(re.escape(d.replace('/', os.sep)) for d in sorted(EXCLUDED_DIRS))
+    + ")(?:" + re.escape(os.sep) + "|$)"
+)
+# Last component of multi-component entries; only these names need the
+# full-path check during the scandir walk
+_EXCLUDED_TAILS = frozenset(d.rsplit('/', 1)[-1] for d in EXCLUDED_DIRS if '/' in d)
 
 
 def _is_excluded_path(path: str) -> bool:
     """Check if path contains any excluded directories."""
-    path_parts = path.split(os.sep)
-    return any(excluded in path_parts for excluded in EXCLUDED_DIRS)
+    return _EXCL_RE.search(path) is not None
+
+
+def _name_matcher(pattern: str) -> Callable[[str], bool]:
+    """Build a file-name test for a search pattern without a directory part.
+
+    Wildcard patterns are matched against the name as given; plain words
+    match anywhere in the name, like the old '**/*word*' glob.
+    """
+    name_pattern = pattern
+    if not pattern.startswith('*'):
+        if not any(c in name_pattern for c in '*?['):
+            return lambda name: name_pattern in name
+        name_pattern = f"*{name_pattern}*"
+    return re.compile(fnmatch.translate(name_pattern)).match
+
+
+def _iter_glob_matches(root: str, pattern: str) -> Iterator[Tuple[str, bool, bool]]:
+    """Yield glob matches for patterns with a directory part, e.g. 'Documents/*.pdf'.
+
+    These match across path components, so they keep the original
+    Path.glob('**/...') search instead of the name-only scandir walk.
+    """
+    if pattern.startswith("*"):
+        search_pattern = f"**/{pattern}"
+    else:
+        search_pattern = f"**/*{pattern}*"
+    
+    for path in Path(root).glob(search_pattern):
+        if _is_excluded_path(str(path)):
+            continue
+        yield str(path), path.is_file(), path.is_dir()
+
+
+def _iter_matches(root: str, pattern: str) -> Iterator[Tuple[str, bool, bool]]:
+    """Yield (path, is_file, is_dir) for matches under root, skipping EXCLUDED_DIRS.
+
+    Walks with os.scandir so excluded subtrees are never entered and type
+    checks reuse the directory entry. Matches in a directory come before
+    those in its subdirectories, the same order Path.glob('**/...') used.
+    """
+    if '/' in pattern:
+        yield from _iter_glob_matches(root, pattern)
+        return
+    
+    matches = _name_matcher(pattern)
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory; skip it like glob did
+        
+        subdirs = []
+        for entry in entries:
+            if entry.name in EXCLUDED_DIRS:
+                continue
+            if entry.name in _EXCLUDED_TAILS and _is_excluded_path(entry.path):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+            if matches(entry.name):
+                try:
+                    is_file, is_dir = entry.is_file(), entry.is_dir()
+                except OSError:
+                    is_file = is_dir = False
+                yield entry.path, is_file, is_dir
+        pending.extend(reversed(subdirs))
+
+
+def _find_matches(root: str, pattern: str, file_type: Optional[str] = None) -> List[str]:
+    """Return up to MAX_RESULTS matching paths under root, cached for SEARCH_CACHE_TTL.
+
+    The cache keeps the unfiltered walk for (root, pattern) and advances it
+    only as far as a caller needs, so find_files and find_and_open_file
+    share one walk and file_type is applied on read.
+    """
+    key = (root, pattern)
+    now = time.monotonic()
+    cached = _SEARCH_CACHE.get(key)
+    if cached is None or now - cached[0] >= SEARCH_CACHE_TTL:
+        # [created, entries walked so far, rest of the walk or None when done]
+        cached = [now, [], _iter_matches(root, pattern)]
+        _SEARCH_CACHE[key] = cached
+    _SEARCH_CACHE.move_to_end(key)
+    if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+        _SEARCH_CACHE.popitem(last=False)
+    
+    walked = cached[1]
+    results: List[str] = []
+    i = 0
+    while len(results) < MAX_RESULTS:
+        if i == len(walked):
+            try:
+                entry = next(cached[2], None) if cached[2] is not None else None
+            except Exception:
+                # A failed walk can't be resumed; don't let repeats see it as empty
+                _SEARCH_CACHE.pop(key, None)
+                raise
+            if entry is None:
+                cached[2] = None
+                break
+            walked.append(entry)
+        path, is_file, is_dir = walked[i]
+        i += 1
+        if file_type == "file" and not is_file:
+            continue
+        if file_type == "directory" and not is_dir:
+            continue
+        results.append(path)
+    return results
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path (following symlinks), or None where os.path.exists is False."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
 
 
 def _expand_path(path: str) -> str:
@@ -52,9 +214,7 @@ def _expand_path(path: str) -> str:
         return HOME_DIR
     
     # Replace common LLM hallucinations
-    path = path.replace('/home/yourname/', '~/')
-    path = path.replace('/home/username/', '~/')
-    path = path.replace('/home/user/', '~/')
+    path = _HALLUCINATED_HOME_RE.sub('~/', path)
     
     # Expand ~ to actual home directory
     path = os.path.expanduser(path)
@@ -70,33 +230,8 @@ def find_files(pattern: str, directory: str = None, file_type: str = None) -> st
     if not os.path.isdir(search_dir):
         return f"Directory not found: {search_dir}"
     
-    results: List[str] = []
-    
-    # Build search pattern - handle both exact and wildcard patterns
-    if pattern.startswith("*") or pattern.startswith("**"):
-        search_pattern = f"**/{pattern}"
-    else:
-        search_pattern = f"**/*{pattern}*"
-    
     try:
-        for path in Path(search_dir).glob(search_pattern):
-            # Skip excluded directories efficiently
-            if _is_excluded_path(str(path)):
-                continue
-            
-            # Filter by type if specified
-            if file_type:
-                if file_type == "file" and not path.is_file():
-                    continue
-                if file_type == "directory" and not path.is_dir():
-                    continue
-            
-            results.append(str(path))
-            if len(results) >= MAX_RESULTS:
-                break
-                
-    except PermissionError:
-        logger.debug(f"Permission denied searching in {search_dir}")
+        results = _find_matches(search_dir, pattern, file_type)
     except Exception as e:
         logger.error(f"find_files error: {e}")
         return f"Search error: {e}"
@@ -105,34 +240,36 @@ def find_files(pattern: str, directory: str = None, file_type: str = None) -> st
         return f"No files found matching '{pattern}'."
     
     # Build simple, TTS-friendly output
-    result = f"Found {len(results)} files:\n"
+    lines = [f"Found {len(results)} files:"]
     
     for i, path in enumerate(results, 1):
         filename = os.path.basename(path)
         parent_dir = os.path.dirname(path)
         folder = os.path.basename(parent_dir) if parent_dir else ""
         # Simple format: "1. filename in folder"
-        result += f"{i}. {filename} in {folder}\n"
+        lines.append(f"{i}. {filename} in {folder}")
     
     if len(results) >= MAX_RESULTS:
-        result += f"Showing first {MAX_RESULTS} results.\n"
+        lines.append(f"Showing first {MAX_RESULTS} results.")
     
-    result += "Say 'open the first one' or use find_and_open_file tool."
-    return result.strip()
+    lines.append("Say 'open the first one' or use find_and_open_file tool.")
+    return "\n".join(lines)
 
 
 def list_directory(path: str = None, show_hidden: bool = False) -> str:
     """List contents of a directory."""
     target_dir = _expand_path(path) if path else HOME_DIR
     
-    if not os.path.exists(target_dir):
+    st = _safe_stat(target_dir)
+    if st is None:
         return f"Path not found: {target_dir}"
     
-    if not os.path.isdir(target_dir):
+    if not stat.S_ISDIR(st.st_mode):
         return f"Not a directory: {target_dir}. Use read_file for files."
     
     try:
-        items = os.listdir(target_dir)
+        with os.scandir(target_dir) as it:
+            entries = list(it)
     except PermissionError:
         return f"Permission denied: {target_dir}"
     except Exception as e:
@@ -141,79 +278,76 @@ def list_directory(path: str = None, show_hidden: bool = False) -> str:
     
     # Filter hidden files if not requested
     if not show_hidden:
-        items = [item for item in items if not item.startswith('.')]
+        entries = [entry for entry in entries if not entry.name.startswith('.')]
     
-    items.sort(key=str.lower)
+    entries.sort(key=lambda entry: entry.name.lower())
     
-    # Categorize into files and directories
+    # Categorize into files and directories. The directory entries already
+    # know their type, so only files need a stat (for their size).
     dirs: List[str] = []
     files: List[str] = []
     
-    for item in items:
-        full_path = os.path.join(target_dir, item)
+    for entry in entries:
+        item = entry.name
         try:
-            if os.path.isdir(full_path):
+            if entry.is_dir():
                 dirs.append(f"📁 {item}/")
             else:
                 # Get file size
-                size = os.path.getsize(full_path)
-                size_str = _format_size(size)
+                size_str = _format_size(entry.stat().st_size)
                 files.append(f"📄 {item} ({size_str})")
         except (OSError, PermissionError):
             files.append(f"📄 {item}")
     
-    display_path = target_dir.replace(HOME_DIR, "~") if target_dir.startswith(HOME_DIR) else target_dir
-    result = f"Contents of {display_path}:\n"
+    display_path = _tildeify(target_dir)
+    lines = [f"Contents of {display_path}:"]
     
     # Show directories first, then files
-    shown_items = 0
     max_per_type = MAX_RESULTS // 2
     
-    for item in dirs[:max_per_type]:
-        result += f"  {item}\n"
-        shown_items += 1
-    for item in files[:max_per_type]:
-        result += f"  {item}\n"
-        shown_items += 1
+    lines.extend(f"  {item}" for item in dirs[:max_per_type])
+    lines.extend(f"  {item}" for item in files[:max_per_type])
+    shown_items = len(lines) - 1
     
     total = len(dirs) + len(files)
     if total > MAX_RESULTS:
-        result += f"  ... and {total - shown_items} more items"
+        lines.append(f"  ... and {total - shown_items} more items")
     
-    return result.strip()
+    return "\n".join(lines)
 
 
 def read_file(path: str, max_lines: int = 50) -> str:
     """Read contents of a text file (limited for safety)."""
     target_path = _expand_path(path)
     
-    if not os.path.exists(target_path):
+    # One stat answers existence, type and size
+    st = _safe_stat(target_path)
+    if st is None:
         return f"File not found: {path}"
     
-    if os.path.isdir(target_path):
+    if stat.S_ISDIR(st.st_mode):
         return f"Path is a directory, not a file: {path}. Use list_directory instead."
     
     # Validate max_lines
     max_lines = max(1, min(max_lines or 50, 200))
     
     # Security: check file size
-    try:
-        size = os.path.getsize(target_path)
-        if size > MAX_FILE_SIZE:
-            return f"File too large ({_format_size(size)}). Max allowed: {_format_size(MAX_FILE_SIZE)}"
-    except OSError as e:
-        return f"Cannot access file: {e}"
+    if st.st_size > MAX_FILE_SIZE:
+        return f"File too large ({_format_size(st.st_size)}). Max allowed: {_format_size(MAX_FILE_SIZE)}"
     
     # Try to read as text
     try:
+        # Keep only the lines that are shown; the rest are just counted
         with open(target_path, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
+            lines = list(islice(f, max_lines))
+            remaining = sum(1 for _ in f)
         
-        display_path = path.replace(HOME_DIR, "~") if path.startswith(HOME_DIR) else path
+        display_path = _tildeify(path)
         
-        if len(lines) > max_lines:
-            content = ''.join(lines[:max_lines])
-            return f"File: {display_path} (showing first {max_lines} of {len(lines)} lines)\n\n{content}"
+        if remaining:
+            content = ''.join(lines)
+            total = max_lines + remaining
+            return f"File: {display_path} (showing first {max_lines} of {total} lines)\n\n{content}"
         else:
             return f"File: {display_path}\n\n{''.join(lines)}"
             
@@ -230,23 +364,22 @@ def get_file_info(path: str) -> str:
     """Get detailed information about a file."""
     target_path = _expand_path(path)
     
-    if not os.path.exists(target_path):
+    stat_info = _safe_stat(target_path)
+    if stat_info is None:
         return f"Path not found: {path}"
     
     try:
-        stat_info = os.stat(target_path)
-        
-        file_type = 'Directory' if os.path.isdir(target_path) else 'File'
-        display_path = path.replace(HOME_DIR, "~") if path.startswith(HOME_DIR) else path
-        
-        result = f"File Info: {display_path}\n"
-        result += f"Type: {file_type}\n"
-        result += f"Size: {_format_size(stat_info.st_size)}\n"
-        result += f"Modified: {datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}\n"
-        result += f"Created: {datetime.fromtimestamp(stat_info.st_ctime).strftime('%Y-%m-%d %H:%M:%S')}\n"
-        result += f"Permissions: {stat.filemode(stat_info.st_mode)}"
+        file_type = 'Directory' if stat.S_ISDIR(stat_info.st_mode) else 'File'
+        display_path = _tildeify(path)
         
-        return result
+        return (
+            f"File Info: {display_path}\n"
+            f"Type: {file_type}\n"
+            f"Size: {_format_size(stat_info.st_size)}\n"
+            f"Modified: {datetime.fromtimestamp(stat_info.st_mtime).strftime(TIMESTAMP_FORMAT)}\n"
+            f"Created: {datetime.fromtimestamp(stat_info.st_ctime).strftime(TIMESTAMP_FORMAT)}\n"
+            f"Permissions: {stat.filemode(stat_info.st_mode)}"
+        )
         
     except PermissionError:
         return f"Permission denied: {path}"
@@ -255,6 +388,51 @@ def get_file_info(path: str) -> str:
         return f"Could not get file info: {e}"
 
 
+def _scan_recent(pending: list, cutoff_time: float, max_depth: int, limit: int,
+                 max_dirs: Optional[int] = None) -> tuple:
+    """Walk (directory, depth) pairs from pending for files newer than cutoff_time.
+
+    Returns (count, heap): how many recent files were seen, and a min-heap
+    of the `limit` newest (mtime, path) pairs. With max_dirs, stops after
+    that many directories and leaves the unvisited ones in pending.
+    """
+    newest: List[tuple] = []
+    total = 0
+    visited = 0
+    while pending and (max_dirs is None or visited < max_dirs):
+        directory, depth = pending.pop()
+        visited += 1
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory; os.walk skipped these too
+        
+        for entry in entries:
+            # Skip hidden files and directories
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir():
+                    # Limit depth to avoid too deep traversal
+                    if (depth <= max_depth and entry.name not in EXCLUDED_DIRS
+                            and not entry.is_symlink()):
+                        pending.append((entry.path, depth + 1))
+                    continue
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            
+            if mtime > cutoff_time:
+                total += 1
+                if len(newest) < limit:
+                    heapq.heappush(newest, (mtime, entry.path))
+                elif mtime > newest[0][0]:
+                    heapq.heapreplace(newest, (mtime, entry.path))
+    
+    return total, newest
+
+
 def get_recent_files(directory: str = None, hours: int = 24, limit: int = 10) -> str:
     """Get recently modified files in a directory."""
     search_dir = _expand_path(directory) if directory else HOME_DIR
@@ -267,52 +445,44 @@ def get_recent_files(directory: str = None, hours: int = 24, limit: int = 10) ->
     limit = max(1, min(limit or 10, 50))
     
     cutoff_time = datetime.now().timestamp() - (hours * 3600)
-    recent_files: List[tuple] = []
     max_depth = 4  # Configurable depth
     
     try:
-        for root, dirs, files in os.walk(search_dir):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith('.')]
-            
-            for file in files:
-                if file.startswith('.'):
-                    continue
-                    
-                full_path = os.path.join(root, file)
-                try:
-                    mtime = os.path.getmtime(full_path)
-                    if mtime > cutoff_time:
-                        recent_files.append((full_path, mtime))
-                except (OSError, PermissionError):
-                    continue
-            
-            # Limit depth to avoid too deep traversal
-            if root.count(os.sep) - search_dir.count(os.sep) > max_depth:
-                dirs.clear()
+        # Scan the top level here, then walk each subdirectory on its own
+        # thread; the time goes into stat calls, which release the GIL
+        pending = [(search_dir, 0)]
+        total, newest = _scan_recent(pending, cutoff_time, max_depth, limit, max_dirs=1)
+        
+        if pending:
+            workers = min(RECENT_WALK_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for count, heap in executor.map(
+                    lambda item: _scan_recent([item], cutoff_time, max_depth, limit),
+                    pending,
+                ):
+                    total += count
+                    newest.extend(heap)
                 
-    except PermissionError:
-        logger.debug(f"Permission denied walking {search_dir}")
     except Exception as e:
         logger.error(f"get_recent_files error: {e}")
         return f"Could not search for recent files: {e}"
     
-    if not recent_files:
+    if not total:
         return f"No files modified in the last {hours} hours in {search_dir}"
     
-    # Sort by modification time (most recent first)
-    recent_files.sort(key=lambda x: x[1], reverse=True)
-    
-    result = f"Files modified in the last {hours} hours:\n"
-    for path, mtime in recent_files[:limit]:
-        display_path = path.replace(HOME_DIR, "~") if path.startswith(HOME_DIR) else path
-        time_str = datetime.fromtimestamp(mtime).strftime('%H:%M')
-        result += f"  {time_str} - {display_path}\n"
+    lines = [f"Files modified in the last {hours} hours:"]
+    # Most recent first
+    for mtime, path in heapq.nlargest(limit, newest):
+        display_path = _tildeify(path)
+        # Only hours and minutes are shown, so skip strftime's format parsing
+        lt = time.localtime(mtime)
+        time_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}"
+        lines.append(f"  {time_str} - {display_path}")
     
-    if len(recent_files) > limit:
-        result += f"  ... and {len(recent_files) - limit} more files"
+    if total > limit:
+        lines.append(f"  ... and {total - limit} more files")
     
-    return result.strip()
+    return "\n".join(lines)
 
 
 def find_and_open_file(pattern: str, which: int = 1, directory: str = None) -> str:
@@ -323,24 +493,8 @@ def find_and_open_file(pattern: str, which: int = 1, directory: str = None) -> s
     if not os.path.isdir(search_dir):
         return f"Directory not found: {search_dir}"
     
-    results: List[str] = []
-    
-    # Build search pattern
-    if pattern.startswith("*") or pattern.startswith("**"):
-        search_pattern = f"**/{pattern}"
-    else:
-        search_pattern = f"**/*{pattern}*"
-    
     try:
-        for path in Path(search_dir).glob(search_pattern):
-            if _is_excluded_path(str(path)):
-                continue
-            if path.is_file():
-                results.append(str(path))
-                if len(results) >= MAX_RESULTS:
-                    break
-    except PermissionError:
-        logger.debug(f"Permission denied searching in {search_dir}")
+        results = _find_matches(search_dir, pattern, "file")
     except Exception as e:
         logger.error(f"find_and_open_file search error: {e}")
         return f"Search error: {e}"
@@ -359,12 +513,7 @@ def find_and_open_file(pattern: str, which: int = 1, directory: str = None) -> s
     folder = os.path.basename(os.path.dirname(target_file))
     
     try:
-        subprocess.Popen(
-            ['xdg-open', target_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True
-        )
+        spawn_detached(['xdg-open', target_file])
         logger.info(f"Opened file: {target_file}")
         return f"Opened {filename} from {folder} folder."
         
@@ -0,0 +1,95 @@
+"""
+Process helpers shared by the tools that launch desktop programs.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+# Launched programs get their stdout/stderr sent to /dev/null
+_DEVNULL_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+] if hasattr(os, "posix_spawnp") else None
+
+REAP_INTERVAL = 1.0  # Seconds between checks for exited programs
+
+# Programs started by spawn_detached that haven't been reaped yet
+_children = set()
+_children_lock = threading.Lock()
+_reaper: Optional[threading.Thread] = None
+
+
+def _inherited_fds() -> Optional[List[int]]:
+    """List descriptors above stderr a child would inherit, or None without /proc."""
+    try:
+        names = os.listdir("/proc/self/fd")
+    except OSError:
+        return None
+    
+    fds = []
+    for name in names:
+        fd = int(name)
+        if fd <= 2:
+            continue
+        try:
+            if os.get_inheritable(fd):
+                fds.append(fd)
+        except OSError:
+            continue  # Closed since the listing, e.g. listdir's own descriptor
+    return fds
+
+
+def _reap_children():
+    """Collect exited programs so they don't linger as zombies; exits when none are left."""
+    global _reaper
+    while True:
+        time.sleep(REAP_INTERVAL)
+        with _children_lock:
+            for pid in list(_children):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid  # Already reaped elsewhere
+                if done:
+                    _children.discard(pid)
+            if not _children:
+                _reaper = None
+                return
+
+
+def spawn_detached(argv: List[str]) -> None:
+    """Start a program in its own session without waiting for it.
+    
+    Uses posix_spawnp, which glibc implements with a vfork-style clone, so
+    launch time does not grow with the assistant's (model-sized) memory
+    footprint. Unlike Popen's close_fds, posix_spawn closes nothing by
+    itself, so every inheritable descriptor (e.g. ones opened by the audio
+    or model libraries) gets an explicit close action; one opened by another
+    thread between that listing and the spawn can still leak. Without
+    /proc/self/fd to list them, it falls back to Popen with close_fds.
+    Raises FileNotFoundError if the program does not exist.
+    """
+    global _reaper
+    inherited = _inherited_fds() if _DEVNULL_ACTIONS is not None else None
+    if inherited is None:
+        subprocess.Popen(
+            argv,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True
+        )
+        return
+    
+    file_actions = _DEVNULL_ACTIONS + [(os.POSIX_SPAWN_CLOSE, fd) for fd in inherited]
+    pid = os.posix_spawnp(argv[0], argv, os.environ,
+                          file_actions=file_actions, setsid=True)
+    # One shared thread reaps every launched program when it exits
+    with _children_lock:
+        _children.add(pid)
+        if _reaper is None:
+            _reaper = threading.Thread(target=_reap_children, daemon=True)
+            _reaper.start()
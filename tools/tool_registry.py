@@ -17,16 +17,28 @@ _TOOL_SCHEMAS: List[Dict] = []
 
 
 def register_tool(name: str, description: str, parameters: Dict, func: Callable):
-    """Register a tool with its schema and implementation."""
-    _TOOL_FUNCTIONS[name] = func
-    _TOOL_SCHEMAS.append({
+    """Register a tool with its schema and implementation.
+
+    Registering a name again replaces the earlier schema in place, so a tool
+    is never listed twice (with possibly different schemas) in the prompt.
+    """
+    schema = {
         "type": "function",
         "function": {
             "name": name,
             "description": description,
             "parameters": parameters
         }
-    })
+    }
+    if name in _TOOL_FUNCTIONS:
+        logger.warning(f"Tool registered twice, replacing: {name}")
+        for i, existing in enumerate(_TOOL_SCHEMAS):
+            if existing["function"]["name"] == name:
+                _TOOL_SCHEMAS[i] = schema
+                break
+    else:
+        _TOOL_SCHEMAS.append(schema)
+    _TOOL_FUNCTIONS[name] = func
     logger.debug(f"Registered tool: {name}")
 
 
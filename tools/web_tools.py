@@ -18,6 +18,19 @@ except ImportError:
         logger.error("ddgs package not installed. Run: pip install ddgs")
         DDGS = None
 
+SEARCH_TIMEOUT = 5  # Seconds per request, bounds tail latency for voice replies
+
+# One client for all searches, so fallbacks reuse its connections and cookies
+_ddgs = None
+
+
+def _get_ddgs():
+    """Return the shared DDGS client, creating it on first use."""
+    global _ddgs
+    if _ddgs is None:
+        _ddgs = DDGS(timeout=SEARCH_TIMEOUT)
+    return _ddgs
+
 
 def perform_search(
     query: str, 
@@ -37,6 +50,7 @@ def perform_search(
     Returns:
         A formatted string containing the search results.
     """
+    global _ddgs
     if not DDGS:
         return "Search unavailable: duckduckgo-search package not installed."
     
@@ -49,24 +63,23 @@ def perform_search(
     results = []
     
     try:
+        ddgs = _get_ddgs()
+        
         # Primary search with provided parameters
-        with DDGS() as ddgs:
-            gen = ddgs.text(query, max_results=max_results, timelimit=timelimit, region=region)
-            results = list(gen) if gen else []
+        gen = ddgs.text(query, max_results=max_results, timelimit=timelimit, region=region)
+        results = list(gen) if gen else []
         
         # Fallback 1: If no results with timelimit, try without
         if not results and timelimit:
             logger.debug("No results with timelimit, retrying without...")
-            with DDGS() as ddgs:
-                gen = ddgs.text(query, max_results=max_results, region=region)
-                results = list(gen) if gen else []
+            gen = ddgs.text(query, max_results=max_results, region=region)
+            results = list(gen) if gen else []
 
         # Fallback 2: If no results in current region, try us-en
         if not results and region != "us-en":
             logger.debug("No results in region, retrying with 'us-en'...")
-            with DDGS() as ddgs:
-                gen = ddgs.text(query, max_results=max_results, region="us-en")
-                results = list(gen) if gen else []
+            gen = ddgs.text(query, max_results=max_results, region="us-en")
+            results = list(gen) if gen else []
 
         if not results:
             return f"No search results found for: {query}"
@@ -91,6 +104,7 @@ def perform_search(
         return "\n".join(formatted_results)
 
     except Exception as e:
+        _ddgs = None  # Start the next search on a fresh client
         logger.error(f"Search failed: {e}")
         return f"Search failed: {str(e)}"
 